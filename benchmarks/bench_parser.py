@@ -0,0 +1,69 @@
+"""Benchmark and regression check for extract_media_info.
+
+Usage (from the repository root):
+    python benchmarks/bench_parser.py [--repeat N] [--scale N]
+
+Every filename in release_names.json is parsed first and compared with the
+pinned output; any difference is printed and the script exits with status 1
+before timing anything.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "release_names.json")
+
+def load_main():
+    # main.py keeps its data files in the working directory, keep them out of the repo
+    sys.path.insert(0, ROOT)
+    os.chdir(tempfile.mkdtemp(prefix="myflixvault-bench-"))
+    import main
+    return main
+
+def check_corpus(main, corpus):
+    failures = 0
+    for case in corpus:
+        result = main.extract_media_info(case['filename'])
+        if result != case['expected']:
+            failures += 1
+            print(f"[FAIL] {case['filename']!r}\n  expected {case['expected']}\n  got      {result}")
+    return failures
+
+def timed(label, func, count):
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms  {count / elapsed:12,.0f} files/s")
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5, help="timing rounds")
+    parser.add_argument('--scale', type=int, default=100, help="copies of the corpus per round")
+    args = parser.parse_args()
+
+    with open(CORPUS, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+    main = load_main()
+
+    failures = check_corpus(main, corpus)
+    if failures:
+        print(f"{failures} of {len(corpus)} filenames changed")
+        sys.exit(1)
+    print(f"{len(corpus)} pinned filenames OK")
+
+    # Make each copy unique so the uncached numbers really parse every name
+    filenames = [case['filename'] for case in corpus]
+    unique = [f"{i}.{name}" for i in range(args.scale) for name in filenames]
+
+    for round_number in range(args.repeat):
+        print(f"round {round_number + 1}")
+        main._parse_media_info.cache_clear()
+        timed("cold (parse every name)", lambda: [main.extract_media_info(n) for n in unique], len(unique))
+        timed("warm (memoized)", lambda: [main.extract_media_info(n) for n in unique], len(unique))
+
+if __name__ == '__main__':
+    main_cli()
@@ -0,0 +1,206 @@
+"""Load test for the main routes against a fake TMDB/OMDb provider.
+
+Usage (from the repository root):
+    python benchmarks/bench_routes.py [--files 1000|10000|100000] [--entries 2000]
+                                      [--requests 200] [--concurrency 8]
+                                      [--latency 0.05] [--error-rate 0.01]
+                                      [--report out.json] [--baseline old.json]
+
+Builds a synthetic media tree and my_list.json in a scratch directory,
+starts benchmarks/fake_provider.py in-process, points main.py at it and
+hammers each route from a thread pool through Flask's test client (no
+sockets, so the numbers are the application's own cost). Prints
+latency percentiles and throughput per route; with --baseline, exits with
+status 1 if any route's p95 got more than --tolerance slower.
+
+Media trees are kept in --workdir between runs, every run starts with an
+empty API cache, library index and poster cache.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from fake_provider import FakeProvider
+from synthetic import make_media_tree, write_collection, WORDS
+
+ROUTES = ('index', 'api_items', 'search', 'trailer', 'trailers', 'local_media',
+          'local_videos', 'poster', 'video_range')
+SLOW_ROUTES = {'local_videos': 10}  # Divide the request count, these render the whole library
+
+def prepare(args):
+    media = os.path.join(args.workdir, f"media-{args.files}")
+    marker = os.path.join(media, ".complete")
+    if not os.path.exists(marker):
+        started = time.perf_counter()
+        make_media_tree(media, args.files)
+        open(marker, 'w').close()
+        print(f"Created {args.files} media files in {time.perf_counter() - started:.1f}s")
+
+    run_dir = tempfile.mkdtemp(prefix="run-", dir=args.workdir)
+    write_collection(os.path.join(run_dir, "my_list.json"), args.entries)
+    with open(os.path.join(run_dir, "settings.json"), 'w') as f:
+        json.dump({"api_provider": args.provider, "api_key": "bench", "local_media_path": media}, f)
+    # main.py keeps its data files in the working directory
+    os.chdir(run_dir)
+    sys.path.insert(0, ROOT)
+    import main
+    return main, media
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))]
+
+class RouteBench:
+    def __init__(self, main, provider, media, seed=1):
+        self.main = main
+        self.provider = provider
+        self.rng = random.Random(seed)
+        self.entries = main.collection.items('series') + main.collection.items('movies')
+        self.videos = [row['path'] for row in main.library_index.files()][:500]
+
+    def request(self, route):
+        # Returns the URL (and headers) for one request to route
+        rng, entry = self.rng, self.rng.choice(self.entries)
+        if route == 'index':
+            return f"/?tab={rng.choice(('series', 'movies'))}", None
+        if route == 'api_items':
+            return f"/api/items?tab={rng.choice(('series', 'movies'))}&cursor={rng.randint(0, 5) * 60}", None
+        if route == 'search':
+            return f"/api/items?tab=movies&q={rng.choice(WORDS)[:rng.randint(3, 5)]}", None
+        if route == 'trailer':
+            return f"/trailer?name={entry['name']}&type={entry['type']}&year={entry['year']}&country={entry['country']}", None
+        if route == 'trailers':
+            return "/trailers?" + "&".join(f"id={e['id']}" for e in rng.sample(self.entries, 10)), None
+        if route == 'local_media':
+            name = os.path.splitext(os.path.basename(rng.choice(self.videos)))[0] if self.videos else entry['name']
+            return f"/local_media?name={self.main.extract_media_info(name)['name']}&type=movie", None
+        if route == 'local_videos':
+            return "/local_videos", None
+        if route == 'poster':
+            url = f"{self.provider.url}/t/p/w500/{rng.randint(0, len(self.entries))}.jpg"
+            return f"/temp/{self.main.thumbnail_worker.register(url, None)}", None
+        if route == 'video_range':
+            start = rng.randint(0, 3 * 1024 * 1024)
+            return (f"/video_file?path={rng.choice(self.videos)}",
+                    {'Range': f"bytes={start}-{start + 1024 * 1024 - 1}"})
+        raise ValueError(route)
+
+    def run(self, route, count, concurrency):
+        requests = [self.request(route) for _ in range(count)]
+
+        def one(item):
+            url, headers = item
+            started = time.perf_counter()
+            try:
+                response = self.main.app.test_client().get(url, headers=headers)
+                response.get_data()  # Drain streamed bodies
+                failed = response.status_code >= 500
+                response.close()
+            except Exception:
+                failed = True
+            return time.perf_counter() - started, failed
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(one, requests))
+        elapsed = time.perf_counter() - started
+        latencies = [latency for latency, _ in results]
+        return {
+            'requests': count,
+            'errors': sum(1 for _, failed in results if failed),
+            'p50_ms': percentile(latencies, 0.50) * 1000,
+            'p95_ms': percentile(latencies, 0.95) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000,
+            'max_ms': max(latencies) * 1000,
+            'throughput_rps': count / elapsed,
+        }
+
+def print_report(report):
+    print(f"{'route':<16}{'reqs':>6}{'errs':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'req/s':>10}")
+    for route, r in report['routes'].items():
+        print(f"{route:<16}{r['requests']:>6}{r['errors']:>6}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}"
+              f"{r['p99_ms']:>10.1f}{r['max_ms']:>10.1f}{r['throughput_rps']:>10.1f}")
+
+def compare(report, baseline, tolerance):
+    if (baseline.get('files'), baseline.get('entries')) != (report['files'], report['entries']):
+        print(f"[WARN] Baseline was run with {baseline.get('files')} files and {baseline.get('entries')} entries")
+    regressions = 0
+    for route, r in report['routes'].items():
+        old = baseline.get('routes', {}).get(route)
+        if not old or not old['p95_ms']:
+            continue
+        change = r['p95_ms'] / old['p95_ms'] - 1
+        if change > tolerance:
+            regressions += 1
+            print(f"[REGRESSION] {route}: p95 {old['p95_ms']:.1f} -> {r['p95_ms']:.1f} ms ({change:+.0%})")
+    return regressions
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=1000, help="media files in the synthetic library")
+    parser.add_argument('--entries', type=int, default=2000, help="entries in the synthetic my_list.json")
+    parser.add_argument('--requests', type=int, default=200, help="requests per route")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--routes', default=",".join(ROUTES), help="comma separated subset of " + ",".join(ROUTES))
+    parser.add_argument('--provider', choices=('tmdb', 'omdb'), default='tmdb')
+    parser.add_argument('--latency', type=float, default=0.05, help="fake provider mean delay in seconds")
+    parser.add_argument('--jitter', type=float, default=0.02)
+    parser.add_argument('--error-rate', type=float, default=0.01, help="share of provider calls failing")
+    parser.add_argument('--workdir', default=os.path.join(tempfile.gettempdir(), "myflixvault-bench"))
+    parser.add_argument('--report', help="write the results as JSON")
+    parser.add_argument('--baseline', help="earlier --report to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed p95 slowdown against the baseline")
+    args = parser.parse_args()
+
+    routes = [route for route in args.routes.split(",") if route]
+    unknown = set(routes) - set(ROUTES)
+    if unknown:
+        parser.error(f"unknown routes: {', '.join(sorted(unknown))}")
+
+    os.makedirs(args.workdir, exist_ok=True)
+    provider = FakeProvider(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate).start()
+    main, media = prepare(args)
+    provider.patch(main)
+
+    started = time.perf_counter()
+    main.ensure_library_index()
+    scan_seconds = time.perf_counter() - started
+    print(f"Library scan of {args.files} files: {scan_seconds:.2f}s")
+
+    bench = RouteBench(main, provider, media)
+    report = {
+        'files': args.files, 'entries': args.entries, 'concurrency': args.concurrency,
+        'provider_latency': args.latency, 'provider_error_rate': args.error_rate,
+        'library_scan_seconds': scan_seconds, 'routes': {},
+    }
+    for route in routes:
+        count = max(5, args.requests // SLOW_ROUTES.get(route, 1))
+        report['routes'][route] = bench.run(route, count, args.concurrency)
+    report['provider_requests'] = provider.requests
+
+    print_report(report)
+    print(f"Fake provider answered {provider.requests} requests")
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            status = 1 if compare(report, json.load(f), args.tolerance) else 0
+    # Don't wait for poster lookups /local_videos left queued in main.py's pools
+    sys.stdout.flush()
+    os._exit(status)
+
+if __name__ == '__main__':
+    main_cli()
@@ -0,0 +1,148 @@
+"""Local stand-in for the TMDB and OMDb APIs.
+
+Usage (from the repository root):
+    python benchmarks/fake_provider.py [--port 8765] [--latency 0.05] [--jitter 0.02] [--error-rate 0.01]
+
+Answers the calls main.py makes (TMDB search, TMDB videos, OMDb title
+lookup and poster images) with deterministic made-up data, after an
+artificial delay. A share of requests fails with 500 or 429 so the retry
+and circuit breaker paths get exercised. Every title is "found" unless it
+starts with "missing", which gives an empty result.
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+from PIL import Image
+
+def title_id(title):
+    return int(hashlib.md5(title.lower().encode('utf-8')).hexdigest()[:6], 16)
+
+def make_poster(width=500, height=750):
+    # One shared JPEG, decoding/resizing cost is what matters, not the pixels
+    img = Image.new('RGB', (width, height))
+    for y in range(0, height, 50):
+        img.paste((y % 256, (y * 3) % 256, (y * 7) % 256), (0, y, width, min(y + 50, height)))
+    out = BytesIO()
+    img.save(out, 'JPEG', quality=85)
+    return out.getvalue()
+
+class FakeProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.count_request()
+        time.sleep(max(0.0, server.random.gauss(server.latency, server.jitter)))
+        if server.random.random() < server.error_rate:
+            status = 429 if server.random.random() < 0.3 else 500
+            return self.send_json({'status_message': 'Injected failure'}, status)
+
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        parts = [p for p in url.path.split('/') if p]
+
+        if parts[:2] == ['3', 'search'] and len(parts) == 3:
+            return self.send_json(self.search(parts[2], query.get('query', '')))
+        if parts[:1] == ['3'] and len(parts) == 4 and parts[3] == 'videos':
+            return self.send_json({'id': int(parts[2]), 'results': [
+                {'type': 'Teaser', 'site': 'YouTube', 'key': f"teaser{parts[2]}"},
+                {'type': 'Trailer', 'site': 'YouTube', 'key': f"trailer{parts[2]}"},
+            ]})
+        if parts[:2] == ['t', 'p']:
+            return self.send_bytes(server.poster, 'image/jpeg')
+        if not parts and 't' in query:
+            return self.send_json(self.omdb(query['t'], query.get('y')))
+        self.send_json({'status_message': 'Not found'}, 404)
+
+    def search(self, search_type, title):
+        if not title or title.lower().startswith('missing'):
+            return {'page': 1, 'results': [], 'total_results': 0}
+        title_key, date_key = ('name', 'first_air_date') if search_type == 'tv' else ('title', 'release_date')
+        results = []
+        for i, name in enumerate((title, f"{title} Returns", f"The {title} Story")):
+            item_id = title_id(name)
+            results.append({
+                'id': item_id,
+                title_key: name,
+                date_key: f"{1980 + item_id % 45}-01-01",
+                'poster_path': f"/{item_id}.jpg",
+            })
+        return {'page': 1, 'results': results, 'total_results': len(results)}
+
+    def omdb(self, title, year):
+        if title.lower().startswith('missing'):
+            return {'Response': 'False', 'Error': 'Movie not found!'}
+        host = self.headers.get('Host')
+        return {'Title': title, 'Year': year or '2000', 'Response': 'True',
+                'Poster': f"http://{host}/t/p/w500/{title_id(title)}.jpg"}
+
+    def send_json(self, data, status=200):
+        self.send_bytes(json.dumps(data).encode('utf-8'), 'application/json', status)
+
+    def send_bytes(self, body, content_type, status=200):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if status == 429:
+            self.send_header('Retry-After', '0')
+        self.end_headers()
+        self.wfile.write(body)
+
+class FakeProvider(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.05, jitter=0.02, error_rate=0.0, seed=1):
+        super().__init__(('127.0.0.1', port), FakeProviderHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.poster = make_poster()
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def count_request(self):
+        with self.lock:
+            self.requests += 1
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, name="fake-provider", daemon=True).start()
+        return self
+
+    def patch(self, main):
+        # Point main.py's provider URLs at this server
+        main.TMDB_API_URL = f"{self.url}/3"
+        main.TMDB_IMAGE_URL = f"{self.url}/t/p/w500"
+        main.OMDB_API_URL = f"{self.url}/"
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.05, help="mean delay per request in seconds")
+    parser.add_argument('--jitter', type=float, default=0.02, help="standard deviation of the delay")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of requests answered with 500/429")
+    args = parser.parse_args()
+
+    server = FakeProvider(args.port, args.latency, args.jitter, args.error_rate)
+    print(f"Fake TMDB/OMDb provider on {server.url} (TMDB at {server.url}/3)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main_cli()
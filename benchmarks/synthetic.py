@@ -0,0 +1,126 @@
+"""Synthetic media trees and collections for the benchmarks.
+
+Usage (from the repository root):
+    python benchmarks/synthetic.py media DIR [--files 10000]
+    python benchmarks/synthetic.py collection my_list.json [--entries 2000]
+
+Both are deterministic for a given size and seed. Media files are sparse,
+so a 100k file tree costs inodes rather than disk space.
+"""
+import argparse
+import json
+import os
+import random
+
+WORDS = (
+    "dark", "night", "star", "river", "last", "king", "city", "ghost", "iron", "blue",
+    "house", "winter", "secret", "lost", "storm", "empire", "silent", "red", "wild", "hidden",
+    "garden", "machine", "crown", "shadow", "ocean", "fire", "glass", "north", "golden", "echo",
+)
+TAGS = ("1080p", "720p", "2160p", "WEB-DL", "BluRay", "x264", "x265", "HEVC", "AAC", "DDP5.1", "HDR")
+EXTENSIONS = (".mkv", ".mp4", ".avi", ".mov")
+COUNTRIES = ("us", "gb", "fr", "jp", "kr", "de", "")
+CONDITIONS = ("watching", "completed", "plan", "")
+SERIES_SHARE = 0.6  # Share of files that are episodes
+EPISODES_PER_SEASON = 12
+FILES_PER_DIR = 250  # Keeps directory listings realistic for big trees
+
+def make_title(rng):
+    return " ".join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(1, 3)))
+
+def release_name(rng, title, year=None, season=None, episode=None):
+    parts = title.split()
+    if season is not None:
+        style = rng.random()
+        if style < 0.6:
+            parts.append(f"S{season:02d}E{episode:02d}")
+        elif style < 0.8:
+            parts.append(f"{season}x{episode:02d}")
+        else:
+            parts.append(f"{(season - 1) * EPISODES_PER_SEASON + episode:03d}")
+    if year:
+        parts.append(str(year))
+    parts += rng.sample(TAGS, rng.randint(1, 3))
+    separator = rng.choice((".", " ", "_"))
+    return separator.join(parts) + rng.choice(EXTENSIONS)
+
+def iter_media_files(count, seed=1):
+    # Yields (relative directory, filename)
+    rng = random.Random(seed)
+    produced = 0
+    used = set()
+    while produced < count:
+        title = make_title(rng)
+        if title in used:
+            title = f"{title} {produced}"
+        used.add(title)
+        if rng.random() < SERIES_SHARE:
+            for season in range(1, rng.randint(1, 4) + 1):
+                for episode in range(1, EPISODES_PER_SEASON + 1):
+                    if produced >= count:
+                        return
+                    yield (os.path.join("Series", title, f"Season {season}"),
+                           release_name(rng, title, season=season, episode=episode))
+                    produced += 1
+        else:
+            bucket = f"Movies {produced // FILES_PER_DIR:04d}"
+            yield os.path.join("Movies", bucket), release_name(rng, title, year=rng.randint(1950, 2025))
+            produced += 1
+
+def make_media_tree(root, count, seed=1, size=4 * 1024 * 1024):
+    # Returns the list of created paths
+    paths = []
+    for directory, filename in iter_media_files(count, seed):
+        directory = os.path.join(root, directory)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, filename)
+        with open(path, 'wb') as f:
+            f.truncate(size)
+        paths.append(path)
+    return paths
+
+def make_collection(entries, seed=1):
+    rng = random.Random(seed)
+    collection = {"series": [], "movies": []}
+    for i in range(entries):
+        title = make_title(rng)
+        if i % 4 == 3:
+            title = f"Missing {title}"  # The fake provider finds nothing for these
+        if rng.random() < 0.5:
+            collection["series"].append({
+                "name": title, "year": "", "country": rng.choice(COUNTRIES), "type": "tv",
+                "poster_url": "", "ep": str(rng.randint(1, 40)), "condition": rng.choice(CONDITIONS),
+            })
+        else:
+            collection["movies"].append({
+                "name": title, "year": str(rng.randint(1950, 2025)), "country": rng.choice(COUNTRIES),
+                "type": "movie", "poster_url": "",
+            })
+    return collection
+
+def write_collection(path, entries, seed=1):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(make_collection(entries, seed), f, indent=4)
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    media = commands.add_parser("media", help="create a media tree")
+    media.add_argument("dir")
+    media.add_argument("--files", type=int, default=10000)
+    media.add_argument("--seed", type=int, default=1)
+    coll = commands.add_parser("collection", help="write a my_list.json")
+    coll.add_argument("file")
+    coll.add_argument("--entries", type=int, default=2000)
+    coll.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.command == "media":
+        paths = make_media_tree(args.dir, args.files, args.seed)
+        print(f"Created {len(paths)} files under {args.dir}")
+    else:
+        write_collection(args.file, args.entries, args.seed)
+        print(f"Wrote {args.entries} entries to {args.file}")
+
+if __name__ == '__main__':
+    main_cli()
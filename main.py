@@ -4,11 +4,63 @@ import hashlib
 import requests
 import re  # Add this import
 import urllib.parse
-from flask import Flask, render_template, request, redirect, url_for, send_from_directory, jsonify, send_file  # Add jsonify, send_file
-from PIL import Image
+from flask import Flask, render_template, request, redirect, url_for, send_from_directory, jsonify, Response, g  # Add jsonify
+from werkzeug.http import http_date
+from werkzeug.exceptions import NotFound
+from werkzeug.serving import make_server
+from PIL import Image, features
 from io import BytesIO
 import base64
-from collections import defaultdict
+import atexit
+import bisect
+import difflib
+import itertools
+import functools
+import mimetypes
+import uuid
+import queue
+import random
+import sys
+import csv
+import argparse
+import signal
+import cProfile
+import gzip
+import shutil
+import subprocess
+from collections import defaultdict, OrderedDict
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+
+# Optional: inotify/FSEvents/ReadDirectoryChangesW based library watching
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = None
+
+# Optional: brotli response compression, gzip is used without it
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# File locking for the single-instance lock, fcntl on Unix, msvcrt on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# Optional: production WSGI server, werkzeug's threaded server is used without it
+try:
+    from waitress import create_server
+except ImportError:
+    create_server = None
 
 SETTINGS_FILE = "settings.json"
 
@@ -19,6 +71,35 @@ class Settings:
         self.poster_api_url = ""
         self.trailer_api_url = ""
         self.local_media_path = ""
+        self.library_scan_interval = 300  # Seconds between background library rescans
+        self.library_poll_interval = 10  # Rescan interval when no filesystem watcher is available
+        self.metadata_workers = 8  # Concurrent poster lookups
+        self.metadata_rate_limit = 20  # Max provider requests per second
+        self.metadata_page_deadline = 2.0  # Seconds a page waits for posters
+        self.api_cache_max_entries = 5000  # Cached provider responses kept on disk
+        self.video_chunk_size = 256 * 1024  # Read buffer per video stream
+        self.video_sendfile = True  # Hand video ranges to the WSGI server's file wrapper (sendfile on gunicorn)
+        self.server_host = "0.0.0.0"
+        self.server_port = 8080
+        self.server_threads = 16  # Worker threads for pages, API calls and posters
+        self.stream_port = 0  # Separate port for video streams, 0 serves them from server_port
+        self.stream_threads = 32  # One per concurrent viewer, streams hold their thread
+        self.server_shutdown_timeout = 10  # Seconds in-flight requests get to finish on shutdown
+        self.event_max_subscribers = 8  # Open /local_videos pages kept up to date, each holds a server thread
+        self.event_stream_lifetime = 300  # Seconds before an event stream ends and the browser reconnects
+        self.transcode_mode = "auto"  # off, auto (only files browsers can't play) or always
+        self.ffmpeg_path = "ffmpeg"
+        self.ffprobe_path = "ffprobe"
+        self.transcode_jobs = 2  # Concurrent ffmpeg processes
+        self.hls_segment_seconds = 6
+        self.hls_cache_max_bytes = 20 * 1024 ** 3  # Disk budget for remuxed/transcoded video
+        self.video_previews = True  # Cut poster frames and seek sprites from local files (needs ffmpeg)
+        self.preview_workers = 1  # Concurrent preview extractions
+        self.preview_cache_max_bytes = 1024 ** 3  # Disk budget for preview frames and sprites
+        self.poster_cache_max_bytes = 512 * 1024 ** 2  # Disk budget for poster thumbnails
+        self.poster_cache_policy = "lru"  # lru or lfu
+        self.profile_requests = False  # Dump cProfile stats of slow requests into profiles/
+        self.profile_min_seconds = 0.5  # Only keep profiles of requests slower than this
         
         # Load settings if exists
         if os.path.exists(SETTINGS_FILE):
@@ -39,35 +120,161 @@ app_settings = Settings()
 
 app = Flask(__name__)
 JSON_FILE = "my_list.json"
+JOURNAL_FILE = "my_list.journal"
 TEMP_FOLDER = "temp"
+LIBRARY_DB = "library.db"
+API_CACHE_DB = "api_cache.db"
+VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.avi', '.mov')
+LIBRARY_WATCH_DEBOUNCE = 1.0  # Seconds of quiet before watcher events are applied
+INSTANCE_LOCK_FILE = "myflixvault.lock"
+
+# The server and the bulk commands all own my_list.json, its journal and the
+# caches, so only one of them may run at a time. The lock is held until the
+# process exits, the OS releases it even after a crash.
+_instance_lock = None
+
+def acquire_instance_lock():
+    global _instance_lock
+    f = open(INSTANCE_LOCK_FILE, 'a+')
+    try:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        f.close()
+        return False
+    _instance_lock = f
+    return True
+
+# Taken before anything below opens the data files. Flask's reloader runs the
+# app in a child process while the parent keeps holding the lock.
+if __name__ == '__main__' and os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+    if not acquire_instance_lock():
+        print(f"[ERROR] MyFlixVault is already running ({INSTANCE_LOCK_FILE} is locked), stop the server first",
+              file=sys.stderr)
+        sys.exit(1)
+
+# In-process metrics, rendered in the Prometheus text format by /metrics.
+# Counters and histograms are updated where the work happens; values that
+# already live elsewhere (cache sizes, active streams) are read by collectors
+# at scrape time.
+METRIC_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class Metrics:
+    def __init__(self, buckets=METRIC_BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.meta = {}  # name -> (type, help)
+        self.counters = defaultdict(float)  # (name, labels) -> value
+        self.histograms = {}  # (name, labels) -> [bucket counts..., sum, count]
+        self.collectors = []
+
+    def describe(self, name, kind, help_text):
+        self.meta[name] = (kind, help_text)
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] += value
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self.lock:
+            values = self.histograms.get(key)
+            if values is None:
+                values = self.histograms[key] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                values[index] += 1
+            values[-2] += seconds
+            values[-1] += 1
+
+    def register_collector(self, collect):
+        # collect() yields (name, labels dict, value) gauges
+        self.collectors.append(collect)
+
+    @staticmethod
+    def _labels(labels):
+        if not labels:
+            return ""
+        escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+        return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}"
+
+    def render(self):
+        samples = defaultdict(list)
+        with self.lock:
+            for (name, labels), value in self.counters.items():
+                samples[name].append(f"{name}{self._labels(labels)} {value:g}")
+            for (name, labels), values in self.histograms.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets, values):
+                    cumulative += count
+                    samples[name].append(f"{name}_bucket{self._labels(labels + (('le', f'{bound:g}'),))} {cumulative}")
+                samples[name].append(f"{name}_bucket{self._labels(labels + (('le', '+Inf'),))} {values[-1]}")
+                samples[name].append(f"{name}_sum{self._labels(labels)} {values[-2]:g}")
+                samples[name].append(f"{name}_count{self._labels(labels)} {values[-1]}")
+        for collect in self.collectors:
+            try:
+                for name, labels, value in collect():
+                    samples[name].append(f"{name}{self._labels(tuple(sorted(labels.items())))} {value:g}")
+            except Exception as e:
+                print(f"[ERROR] Metrics collector failed: {e}")
+
+        lines = []
+        for name in sorted(samples):
+            kind, help_text = self.meta.get(name, ('untyped', ''))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples[name])
+        return "\n".join(lines) + "\n"
+
+metrics = Metrics()
+metrics.describe('myflixvault_request_seconds', 'histogram', 'Time to build a response, per route (streams: until the first byte)')
+metrics.describe('myflixvault_requests_total', 'counter', 'Requests handled, per route and status')
+metrics.describe('myflixvault_upstream_request_seconds', 'histogram', 'Provider API call latency, per host')
+metrics.describe('myflixvault_upstream_requests_total', 'counter', 'Provider API calls, per host and outcome')
+metrics.describe('myflixvault_poster_cache_total', 'counter', 'Poster thumbnail lookups, hit when already generated')
+metrics.describe('myflixvault_thumbnail_seconds', 'histogram', 'Poster thumbnail generation time')
+metrics.describe('myflixvault_library_scan_seconds', 'histogram', 'Full local library scan duration')
 
 # Ensure temp directory exists
 os.makedirs(TEMP_FOLDER, exist_ok=True)
 
-import os
-import re
-
-def extract_media_info(filename):
+# Filename parsing patterns, compiled once. The junk tags and standalone
+# episode-like numbers are stripped in a single combined pass.
+_SEPARATORS_RE = re.compile(r'[_\-.]+')
+_YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2}|202\d)\b')
+_EPISODE_RES = (
+    re.compile(r'\bs(\d{1,2})e(\d{1,2})\b'),
+    re.compile(r'\b(\d{1,2})x(\d{1,2})\b'),
+)
+_JUNK_RE = re.compile(
+    r'\b\d{3,5}\b'  # Standalone episode-like numbers (e.g., One Piece 1015)
+    r'|\b(?:web[-_. ]?dl|nf|hdtv|mycima|wecima|show|tube|autos|ink|world|ar|weciima|mp4|ova|web)\b'
+    r'|\b(?:1080p|720p|4k|bluray|webrip|hdrip)\b'
+    r'|\bsp\b',
+    re.IGNORECASE,
+)
+_SPACES_RE = re.compile(r'\s+')
+
+@functools.lru_cache(maxsize=65536)
+def _parse_media_info(filename):
     name = os.path.splitext(filename)[0]
-    original_name = name
-
-    # Replace separators with space
-    name = re.sub(r'[_\-.]+', ' ', name)
 
-    # Convert to lowercase for uniform processing
-    name = name.lower()
+    # Replace separators with space and lowercase for uniform processing
+    name = _SEPARATORS_RE.sub(' ', name).lower()
 
-    # Initialize info
     info = {'name': name.strip(), 'type': 'movie'}
 
-    # Try to extract year
-    year_match = re.search(r'\b(19\d{2}|20\d{2}|202\d)\b', name)
+    year_match = _YEAR_RE.search(name)
     if year_match:
         info['year'] = year_match.group(1)
         name = name.replace(info['year'], '')
 
-    # Detect episode formats
-    ep_match = re.search(r'\bs(\d{1,2})e(\d{1,2})\b', name) or re.search(r'\b(\d{1,2})x(\d{1,2})\b', name)
+    # Detect episode formats, SxxEyy takes precedence over NxNN
+    ep_match = _EPISODE_RES[0].search(name) or _EPISODE_RES[1].search(name)
     if ep_match:
         info['type'] = 'series'
         info['season'] = int(ep_match.group(1))
@@ -75,168 +282,2077 @@ def extract_media_info(filename):
         info['episode_str'] = f"S{info['season']:02d}E{info['episode']:02d}"
         name = name.replace(ep_match.group(0), '')
 
-    # Remove any standalone episode-like numbers (e.g., One Piece 1015)
-    name = re.sub(r'\b\d{3,5}\b', '', name)
-
-    # Remove known junk tags
-    junk_tags = [
-        r'\b(web[-_. ]?dl|nf|hdtv|mycima|wecima|show|tube|autos|ink|world|ar|weciima|mp4|ova|web)\b',
-        r'\b(1080p|720p|4k|bluray|webrip|hdrip)\b',
-        r'\bsp\b',
-    ]
-    for pattern in junk_tags:
-        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-
-    # Clean up extra spaces
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _JUNK_RE.sub('', name)
 
     # Final display name
-    info['name'] = name.title()
-
+    info['name'] = _SPACES_RE.sub(' ', name).strip().title()
     return info
 
+def extract_media_info(filename):
+    # Results are memoized by filename, hand out copies so callers can't
+    # change the cached dict
+    return dict(_parse_media_info(filename))
+
+def normalize_title(text):
+    return re.sub(r'[^a-z0-9]', '', text.lower())
+
+# Persistent index of the local media library.
+# Directories are only re-listed when their mtime changes, so a rescan of an
+# unchanged tree costs one stat() per directory instead of a full os.walk.
+class LibraryIndex:
+    def __init__(self, db_path):
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, parent TEXT, mtime REAL);
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                dir TEXT,
+                name TEXT,
+                normalized TEXT,
+                size INTEGER,
+                mtime REAL,
+                info TEXT
+            );
+            CREATE INDEX IF NOT EXISTS files_dir ON files (dir);
+            CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent);
+        """)
+        self.conn.commit()
+        self.generation = 0  # Bumped every time a refresh changes the index
+        self.last_scan = 0
+        self.listeners = []  # Called with (generation, added paths, removed paths)
+
+    def _get_meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def is_ready(self, root):
+        with self.lock:
+            return self._get_meta('root') == os.path.normpath(root)
+
+    def _make_row(self, dir_path, name, stat, info):
+        return (
+            os.path.join(dir_path, name),
+            dir_path,
+            name,
+            normalize_title(os.path.splitext(name)[0]),
+            stat.st_size,
+            stat.st_mtime,
+            json.dumps(info),
+        )
+
+    def _rescan_dir(self, dir_path):
+        # List one directory and sync its file rows, returns its subdirectories
+        subdirs = []
+        current = {}
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(VIDEO_EXTENSIONS) and entry.is_file():
+                        current[entry.name] = entry.stat()
+                except OSError:
+                    continue
+
+        known = {
+            name: (size, mtime)
+            for name, size, mtime in self.conn.execute(
+                "SELECT name, size, mtime FROM files WHERE dir = ?", (dir_path,))
+        }
+        removed = [os.path.join(dir_path, name) for name in known if name not in current]
+        names = [name for name, stat in current.items() if known.get(name) != (stat.st_size, stat.st_mtime)]
+        changed = [
+            self._make_row(dir_path, name, current[name], info)
+            for name, info in zip(names, map(extract_media_info, names))
+        ]
+        self.conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in removed])
+        self.conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", changed)
+        return subdirs, [row[0] for row in changed], removed
+
+    def refresh(self, root):
+        root = os.path.normpath(root)
+        started = time.time()
+        with self.lock:
+            if self._get_meta('root') != root:
+                # Media path changed, start over
+                self.conn.execute("DELETE FROM dirs")
+                self.conn.execute("DELETE FROM files")
+
+            known_dirs = {
+                path: mtime for path, mtime in self.conn.execute("SELECT path, mtime FROM dirs")
+            }
+            seen = set()
+            added, removed = [], []
+            stack = [(root, None)]
+            while stack:
+                dir_path, parent = stack.pop()
+                try:
+                    mtime = os.stat(dir_path).st_mtime
+                except OSError:
+                    continue
+                seen.add(dir_path)
+
+                if known_dirs.get(dir_path) == mtime:
+                    # Directory listing unchanged, reuse the known subdirectories
+                    subdirs = [row[0] for row in self.conn.execute(
+                        "SELECT path FROM dirs WHERE parent = ?", (dir_path,))]
+                else:
+                    try:
+                        subdirs, dir_added, dir_removed = self._rescan_dir(dir_path)
+                    except OSError as e:
+                        print(f"[WARN] Cannot scan {dir_path}: {e}")
+                        continue
+                    added += dir_added
+                    removed += dir_removed
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO dirs (path, parent, mtime) VALUES (?, ?, ?)",
+                        (dir_path, parent, mtime))
+                stack.extend((sub, dir_path) for sub in subdirs)
+
+            gone = [path for path in known_dirs if path not in seen]
+            for path in gone:
+                removed += [row[0] for row in self.conn.execute("SELECT path FROM files WHERE dir = ?", (path,))]
+                self.conn.execute("DELETE FROM dirs WHERE path = ?", (path,))
+                self.conn.execute("DELETE FROM files WHERE dir = ?", (path,))
+
+            self._set_meta('root', root)
+            self.conn.commit()
+            self.last_scan = time.time()
+            changed = bool(added or removed or gone)
+            if changed:
+                self._notify(added, removed)
+        metrics.observe('myflixvault_library_scan_seconds', time.time() - started)
+        if changed:
+            print(f"[INFO] Library scan of {root} took {time.time() - started:.2f}s "
+                  f"({len(added)} added, {len(removed)} removed)")
+        return changed
+
+    def apply_changes(self, changes):
+        # Incremental update from the watcher, changes maps path -> 'upsert' or 'delete'
+        added, removed = [], []
+        with self.lock:
+            for path, action in changes.items():
+                stat = None
+                if action == 'upsert':
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        pass
+                if stat is None:
+                    if self.conn.execute("DELETE FROM files WHERE path = ?", (path,)).rowcount:
+                        removed.append(path)
+                    continue
+                dir_path, name = os.path.split(path)
+                self.conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                  self._make_row(dir_path, name, stat, extract_media_info(name)))
+                added.append(path)
+            self.conn.commit()
+            if added or removed:
+                self._notify(added, removed)
+        return bool(added or removed)
+
+    def _notify(self, added, removed):
+        self.generation += 1
+        for listener in self.listeners:
+            try:
+                listener(self.generation, added, removed)
+            except Exception as e:
+                print(f"[ERROR] Library listener failed: {e}")
+
+    def _rows(self, query, params=()):
+        with self.lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [
+            {
+                'path': path,
+                'name': name,
+                'size': size,
+                'mtime': mtime,
+                'info': json.loads(info),
+            }
+            for path, name, size, mtime, info in rows
+        ]
+
+    def files(self):
+        return self._rows("SELECT path, name, size, mtime, info FROM files ORDER BY path")
+
+    def search(self, normalized_name):
+        return self._rows(
+            "SELECT path, name, size, mtime, info FROM files WHERE instr(normalized, ?) > 0 ORDER BY path",
+            (normalized_name,))
+
+library_index = LibraryIndex(LIBRARY_DB)
+
+def media_path_ready():
+    # An unset path would scan the working directory
+    base_path = app_settings.local_media_path
+    return bool(base_path) and os.path.isdir(base_path)
 
+def ensure_library_index():
+    # Only the very first request for a media path has to wait for a scan,
+    # afterwards the background scanner keeps the index fresh.
+    base_path = app_settings.local_media_path
+    with library_index.lock:
+        if not library_index.is_ready(base_path):
+            library_index.refresh(base_path)
+    return library_index
+
+# Episode index over the local library: series -> season -> episode, rebuilt
+# once per library change instead of on every request. SxxEyy/NxNN files are
+# episodes as parsed; "Title 1015"-style absolute numbers only count when at
+# least two files of the same title carry different numbers, so a lone
+# "Movie 300" stays a movie.
+_ABSOLUTE_EPISODE_RE = re.compile(r'\s*(?:e|ep|episode)?\s*(\d{1,4})(?:v\d)?\b')
+_EPISODE_REF_RES = (
+    re.compile(r'^s(\d{1,2})e(\d{1,4})$'),
+    re.compile(r'^(\d{1,2})x(\d{1,4})$'),
+    re.compile(r'^(?:e|ep|episode)?(\d{1,4})$'),
+)
+
+def absolute_episode_number(filename, info):
+    # The number right after the title in "One.Piece.1015.1080p.mkv"
+    stem = _SEPARATORS_RE.sub(' ', os.path.splitext(filename)[0]).lower()
+    title = info['name'].lower()
+    start = stem.find(title) if title else -1
+    if start < 0:
+        return None
+    match = _ABSOLUTE_EPISODE_RE.match(stem, start + len(title))
+    if not match or match.group(1) == info.get('year'):
+        return None
+    return int(match.group(1))
+
+def parse_episode_ref(ep):
+    # The 'ep' field of a series entry ("1015", "S01E05", "1x05", "E5") as
+    # (season, episode), season is None for absolute numbers
+    text = re.sub(r'\s+', '', str(ep or '')).lower()
+    match = _EPISODE_REF_RES[0].match(text) or _EPISODE_REF_RES[1].match(text)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    match = _EPISODE_REF_RES[2].match(text)
+    if match:
+        return None, int(match.group(1))
+    return None
+
+class EpisodeIndex:
+    def __init__(self, library):
+        self.library = library
+        self.lock = threading.Lock()
+        self.generation = None
+        self.series = {}  # normalized title -> series record
+        self.by_path = {}  # file path -> (normalized title, position)
+
+    def _build(self):
+        numbered = defaultdict(list)  # normalized title -> [(season, episode, label, row)]
+        absolute = defaultdict(list)
+        names = {}
+        for row in self.library.files():
+            info = row['info']
+            if not info['name']:
+                continue
+            key = normalize_title(info['name'])
+            if info['type'] == 'series':
+                numbered[key].append((info['season'], info['episode'], info['episode_str'], row))
+            else:
+                number = absolute_episode_number(row['name'], info)
+                if number is None:
+                    continue
+                absolute[key].append((None, number, str(number), row))
+            names.setdefault(key, info['name'])
+        for key, files in absolute.items():
+            if len({number for _, number, _, _ in files}) > 1:
+                numbered[key] += files
+
+        series, by_path = {}, {}
+        for key, files in numbered.items():
+            # Absolute numbering first if a show mixes both
+            files.sort(key=lambda f: (f[0] is not None, f[0] or 0, f[1], f[3]['path']))
+            episodes, index, ordinal = [], {}, []
+            for season, episode, label, row in files:
+                if (season, episode) not in index:
+                    index[(season, episode)] = len(episodes)
+                    ordinal.append(len(episodes))
+                episodes.append({'season': season, 'episode': episode, 'label': label,
+                                 'name': row['name'], 'path': row['path']})
+            # Next distinct episode for every position, extra copies of the
+            # same episode (720p and 1080p, say) are skipped
+            following = [None] * len(episodes)
+            upcoming = None
+            for position in range(len(episodes) - 1, -1, -1):
+                following[position] = upcoming
+                episode = episodes[position]
+                if index[(episode['season'], episode['episode'])] == position:
+                    upcoming = position
+            seasons = defaultdict(dict)
+            for (season, episode), position in index.items():
+                seasons[season][episode] = position
+            series[key] = {'key': key, 'name': names[key], 'episodes': episodes, 'index': index,
+                           'ordinal': ordinal, 'next': following, 'seasons': dict(seasons)}
+            for position, episode in enumerate(episodes):
+                by_path[episode['path']] = (key, position)
+        return series, by_path
+
+    def _snapshot(self):
+        with self.lock:
+            generation = self.library.generation
+            if generation != self.generation:
+                self.series, self.by_path = self._build()
+                self.generation = generation
+            return self.series, self.by_path
+
+    def all_series(self):
+        return list(self._snapshot()[0].values())
+
+    def is_episode(self, path):
+        return path in self._snapshot()[1]
+
+    def get(self, name):
+        # Exact title first, then the shortest title containing the name
+        series = self._snapshot()[0]
+        key = normalize_title(name or '')
+        if not key:
+            return None
+        if key in series:
+            return series[key]
+        matches = [k for k in series if key in k]
+        return series[min(matches, key=len)] if matches else None
+
+    @staticmethod
+    def locate(record, ep):
+        # Position of the entry's 'ep' among the series' files, or None
+        ref = parse_episode_ref(ep)
+        if not record or not ref:
+            return None
+        season, number = ref
+        position = record['index'].get(ref)
+        if position is None and season is None and number >= 1 and None not in record['seasons']:
+            # An absolute count for a show numbered by season
+            if number <= len(record['ordinal']):
+                position = record['ordinal'][number - 1]
+        return position
+
+    def next_episode(self, path):
+        series, by_path = self._snapshot()
+        found = by_path.get(path)
+        if not found:
+            return None
+        record = series[found[0]]
+        following = record['next'][found[1]]
+        return record['episodes'][following] if following is not None else None
+
+    def continue_watching(self, entries, matches):
+        # For each series entry with local files: the file of its current
+        # episode and the one after it. An entry without 'ep' starts at the
+        # first episode. Entries are resolved through the match index, not
+        # by name, so "Up" doesn't pick up "Upload".
+        series = self._snapshot()[0]
+        results = []
+        for entry in entries:
+            match = matches.get(entry.get('id'))
+            record = series.get(match['series']) if match and match['kind'] == 'series' else None
+            if not record or not record['episodes']:
+                continue
+            if entry.get('ep'):
+                position = self.locate(record, entry['ep'])
+                following = record['next'][position] if position is not None else None
+            else:
+                position, following = None, 0
+            results.append({
+                'id': entry.get('id'),
+                'name': entry.get('name'),
+                'ep': entry.get('ep', ''),
+                'current': record['episodes'][position] if position is not None else None,
+                'next': record['episodes'][following] if following is not None else None,
+            })
+        return results
+
+episode_index = EpisodeIndex(library_index)
+
+# Event fan-out for server-sent events, each subscriber gets its own queue.
+# Every subscriber holds a server thread, so their number is capped, and
+# close() hands each one None so its stream ends on shutdown.
+class EventBroadcaster:
+    def __init__(self, max_subscribers):
+        self.lock = threading.Lock()
+        self.subscribers = set()
+        self.max_subscribers = max_subscribers
+        self.closed = False
+
+    def subscribe(self):
+        # Returns None when full or shutting down
+        with self.lock:
+            if self.closed or len(self.subscribers) >= self.max_subscribers:
+                return None
+            subscriber = queue.Queue(maxsize=100)
+            self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+
+    def publish(self, event):
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                pass  # Slow client, it reloads the whole list on the next event anyway
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            subscribers = list(self.subscribers)
+        for subscriber in subscribers:
+            while True:
+                try:
+                    subscriber.put_nowait(None)
+                    break
+                except queue.Full:
+                    try:
+                        subscriber.get_nowait()
+                    except queue.Empty:
+                        pass
+
+library_events = EventBroadcaster(app_settings.event_max_subscribers)
+library_index.listeners.append(
+    lambda generation, added, removed: library_events.publish(
+        {'generation': generation, 'added': len(added), 'removed': len(removed)}))
+
+# Keeps the library index live from filesystem events. Events are collected
+# for a short debounce window and coalesced per path, so a rename is one
+# delete plus one upsert and a file being copied is indexed once.
+class LibraryWatcher:
+    def __init__(self, index, debounce):
+        self.index = index
+        self.debounce = debounce
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.rescan = False
+        self.timer = None
+        self.observer = None
+        self.root = None
+
+    def watch(self, root):
+        if Observer is None:
+            return False
+        root = os.path.normpath(root)
+        if self.observer and self.root == root:
+            return True
+        self.stop()
+        handler = FileSystemEventHandler()
+        handler.on_any_event = self.on_event
+        self.observer = Observer()
+        self.observer.schedule(handler, root, recursive=True)
+        self.observer.daemon = True
+        self.observer.start()
+        self.root = root
+        print(f"[INFO] Watching {root} for changes")
+        return True
+
+    def stop(self):
+        if self.observer:
+            self.observer.stop()
+            self.observer = None
+            self.root = None
+
+    def on_event(self, event):
+        if event.event_type not in ('created', 'deleted', 'modified', 'moved', 'closed'):
+            return
+        with self.lock:
+            if event.is_directory:
+                # Whole folders appearing or moving, let the mtime scan sort it out
+                if event.event_type in ('created', 'deleted', 'moved'):
+                    self.rescan = True
+            elif event.event_type == 'moved':
+                self._mark(event.src_path, 'delete')
+                self._mark(event.dest_path, 'upsert')
+            elif event.event_type == 'deleted':
+                self._mark(event.src_path, 'delete')
+            else:
+                self._mark(event.src_path, 'upsert')
+
+            if self.timer:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.debounce, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _mark(self, path, action):
+        if path.lower().endswith(VIDEO_EXTENSIONS):
+            self.pending[os.path.normpath(path)] = action
+
+    def flush(self):
+        with self.lock:
+            changes, self.pending = self.pending, {}
+            rescan, self.rescan = self.rescan, False
+            root = self.root
+        try:
+            if changes:
+                self.index.apply_changes(changes)
+            if rescan and root:
+                self.index.refresh(root)
+        except Exception as e:
+            print(f"[ERROR] Applying library changes failed: {e}")
 
+library_watcher = LibraryWatcher(library_index, LIBRARY_WATCH_DEBOUNCE)
 
-# Modify get_movie_poster function
-def get_movie_poster(movie_name, typeis, year=None, region=None):
-    settings = app_settings
-
-    if settings.api_provider == "omdb":
-        # OMDB implementation
-        base_url = 'http://www.omdbapi.com/'
-        params = {
-            'apikey': settings.api_key,
-            't': movie_name,
-            'type': 'movie' if typeis.lower() == 'movie' else 'series',
-            'y': year
+def library_scanner():
+    while True:
+        # With a filesystem watcher the periodic scan is only a safety net,
+        # without one it polls directory mtimes more often.
+        base_path = app_settings.local_media_path
+        watching = False
+        if media_path_ready():
+            try:
+                watching = library_watcher.watch(base_path)
+            except Exception as e:
+                print(f"[WARN] Cannot watch {base_path}, polling instead: {e}")
+            try:
+                library_index.refresh(base_path)
+            except Exception as e:
+                print(f"[ERROR] Library scan failed: {e}")
+        if watching:
+            interval = max(int(app_settings.library_scan_interval or 0), 5)
+        else:
+            interval = max(int(app_settings.library_poll_interval or 0), 2)
+        time.sleep(interval)
+
+_background_started = False
+_background_lock = threading.Lock()
+
+def start_background_services():
+    global _background_started
+    with _background_lock:
+        if _background_started:
+            return
+        _background_started = True
+    # Startup cleanup, left out of the import so the CLI never touches the caches
+    poster_store.verify()
+    hls_transcoder.cleanup()
+    threading.Thread(target=library_scanner, name="library-scanner", daemon=True).start()
+    threading.Thread(target=collection_compactor, name="collection-compactor", daemon=True).start()
+    threading.Thread(target=trailer_refresher, name="trailer-refresher", daemon=True).start()
+    threading.Thread(target=preview_backfiller, name="preview-backfill", daemon=True).start()
+    threading.Thread(target=poster_warmer, name="poster-warmer", daemon=True).start()
+
+@app.before_request
+def _start_background_services():
+    start_background_services()
+
+
+# Shared HTTP session so provider calls reuse pooled connections
+http = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+http.mount('https://', _http_adapter)
+http.mount('http://', _http_adapter)
+HTTP_TIMEOUT = 10
+HTTP_RETRIES = 2  # Extra attempts after a timeout, connection error, 429 or 5xx
+HTTP_BACKOFF = 0.5  # Base delay in seconds, doubled per attempt with jitter
+HTTP_MAX_RETRY_AFTER = 10  # Never honour a Retry-After longer than this
+CIRCUIT_FAILURES = 5  # Consecutive failures that open a host's circuit
+CIRCUIT_RESET_AFTER = 30  # Seconds before an open circuit lets a trial request through
+
+class CircuitOpenError(requests.RequestException):
+    pass
+
+# Stops calling a host that keeps failing, so a slow provider fails fast
+# instead of tying up every Flask worker until its timeout.
+class CircuitBreaker:
+    def __init__(self, failures, reset_after):
+        self.max_failures = failures
+        self.reset_after = reset_after
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            # Half-open: let one request through once the cool-down has passed
+            if time.monotonic() - self.opened_at >= self.reset_after:
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.max_failures:
+                self.opened_at = time.monotonic()
+
+class HttpClient:
+    def __init__(self, session, timeout=HTTP_TIMEOUT, retries=HTTP_RETRIES, backoff=HTTP_BACKOFF):
+        self.session = session
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.lock = threading.Lock()
+        self.breakers = {}
+
+    def breaker(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(CIRCUIT_FAILURES, CIRCUIT_RESET_AFTER)
+            return self.breakers[host]
+
+    def _delay(self, attempt, response=None):
+        if response is not None and response.headers.get('Retry-After'):
+            try:
+                return min(float(response.headers['Retry-After']), HTTP_MAX_RETRY_AFTER)
+            except ValueError:
+                pass  # An HTTP date, fall back to backoff
+        return min(self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5), HTTP_MAX_RETRY_AFTER)
+
+    def get(self, url, params=None):
+        host = urllib.parse.urlsplit(url).netloc
+        breaker = self.breaker(url)
+        if not breaker.allow():
+            metrics.inc('myflixvault_upstream_requests_total', host=host, outcome='circuit_open')
+            raise CircuitOpenError(f"Circuit open for {host}")
+
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            started = time.monotonic()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                metrics.observe('myflixvault_upstream_request_seconds', time.monotonic() - started, host=host)
+                metrics.inc('myflixvault_upstream_requests_total', host=host, outcome='error')
+                if last_attempt:
+                    breaker.record_failure()
+                    raise
+                time.sleep(self._delay(attempt))
+                continue
+
+            metrics.observe('myflixvault_upstream_request_seconds', time.monotonic() - started, host=host)
+            metrics.inc('myflixvault_upstream_requests_total', host=host, outcome=str(response.status_code))
+            if response.status_code == 429 or response.status_code >= 500:
+                if last_attempt:
+                    breaker.record_failure()
+                    return response
+                time.sleep(self._delay(attempt, response))
+                continue
+
+            breaker.record_success()
+            return response
+
+provider_http = HttpClient(http)
+
+# Persistent cache for provider API responses, keyed by endpoint and the
+# normalized query parameters. Misses are kept for a shorter time so a
+# title that isn't found yet can show up later without hammering the API.
+API_CACHE_TTLS = {
+    'search': 7 * 24 * 3600,
+    'videos': 3 * 24 * 3600,
+    'omdb': 7 * 24 * 3600,
+    'custom': 24 * 3600,
+}
+API_CACHE_NEGATIVE_TTL = 3600
+API_CACHE_ACCESS_FLUSH = 60  # Seconds between writes of hit times, not one commit per hit
+
+class ResponseCache:
+    def __init__(self, db_path, ttls, negative_ttl, max_entries):
+        self.ttls = ttls
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT,
+                value TEXT,
+                negative INTEGER,
+                expires REAL,
+                last_access REAL
+            );
+            CREATE INDEX IF NOT EXISTS responses_access ON responses (last_access);
+        """)
+        self.conn.commit()
+        self.count = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        self.stats = defaultdict(lambda: {'hits': 0, 'negative_hits': 0, 'misses': 0, 'evictions': 0})
+        self.accessed = {}  # key -> last hit time not yet written
+        self.last_flush = time.time()
+
+    @staticmethod
+    def make_key(endpoint, url, params):
+        normalized = []
+        for key, value in sorted((params or {}).items()):
+            if value is None or value == '' or key == 'api_key' or key == 'apikey':
+                continue
+            normalized.append((key, re.sub(r'\s+', ' ', str(value)).strip().lower()))
+        return endpoint + '|' + url + '?' + urllib.parse.urlencode(normalized)
+
+    def get(self, endpoint, key):
+        # Returns (found, value)
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value, negative, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row and row[2] > now:
+                self.accessed[key] = now
+                if now - self.last_flush > API_CACHE_ACCESS_FLUSH:
+                    self._flush()
+                self.stats[endpoint]['negative_hits' if row[1] else 'hits'] += 1
+                return True, json.loads(row[0])
+            if row:
+                self.accessed.pop(key, None)
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.conn.commit()
+                self.count -= 1
+            self.stats[endpoint]['misses'] += 1
+            return False, None
+
+    def set(self, endpoint, key, value, negative=False):
+        now = time.time()
+        ttl = self.negative_ttl if negative else self.ttls.get(endpoint, self.negative_ttl)
+        with self.lock:
+            exists = self.conn.execute("SELECT 1 FROM responses WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, json.dumps(value), int(negative), now + ttl, now))
+            if not exists:
+                self.count += 1
+            if self.count > self.max_entries:
+                # Drop the least recently used entries, with the latest hit times
+                self._flush()
+                overflow = self.count - self.max_entries
+                self.conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY last_access LIMIT ?)", (overflow,))
+                self.count -= overflow
+                self.stats[endpoint]['evictions'] += overflow
+            self.conn.commit()
+
+    def _flush(self):
+        # Called with the lock held
+        self.conn.executemany("UPDATE responses SET last_access = ? WHERE key = ?",
+                              [(when, key) for key, when in self.accessed.items()])
+        self.conn.commit()
+        self.accessed = {}
+        self.last_flush = time.time()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def get_stats(self):
+        with self.lock:
+            endpoints = {endpoint: dict(counts) for endpoint, counts in self.stats.items()}
+        hits = sum(c['hits'] + c['negative_hits'] for c in endpoints.values())
+        misses = sum(c['misses'] for c in endpoints.values())
+        return {
+            'entries': self.count,
+            'max_entries': self.max_entries,
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': hits / (hits + misses) if hits + misses else 0.0,
+            'endpoints': endpoints,
         }
-        response = requests.get(base_url, params=params)
-        data = response.json()
-        return data.get('Poster') if 'Poster' in data else None
-
-    elif settings.api_provider == "custom" and settings.poster_api_url:
-        # Custom API implementation
-        base_url = settings.poster_api_url
-        # Example: response = requests.get(base_url, params={...})
-        # return response.json().get('poster_url')
+
+api_cache = ResponseCache(API_CACHE_DB, API_CACHE_TTLS, API_CACHE_NEGATIVE_TTL,
+                          int(app_settings.api_cache_max_entries))
+atexit.register(api_cache.flush)
+
+def cached_get_json(endpoint, url, params, is_negative, check_status=True):
+    key = api_cache.make_key(endpoint, url, params)
+    found, data = api_cache.get(endpoint, key)
+    if found:
+        return data
+    response = provider_http.get(url, params=params)
+    if check_status:
+        response.raise_for_status()
+    data = response.json()
+    if response.ok:
+        api_cache.set(endpoint, key, data, negative=is_negative(data))
+    return data
+
+def _no_results(data):
+    return not data.get('results')
+
+# Metadata providers. Each one knows how to find a poster and a trailer for
+# a title; get_provider() picks the configured one. Extra backends can be
+# added with register_provider().
+TMDB_API_URL = 'https://api.themoviedb.org/3'
+TMDB_IMAGE_URL = 'https://image.tmdb.org/t/p/w500'
+OMDB_API_URL = 'http://www.omdbapi.com/'
+
+class MetadataProvider:
+    def __init__(self, settings):
+        self.settings = settings
+
+    def find_poster(self, name, media_type, year=None, region=None):
+        return None
+
+    def find_trailer(self, name, media_type, year=None, region=None):
+        # Returns {'trailer_url': ..., 'tmdb_id': ..., 'trailer_key': ...} or None
         return None
 
-    else:  # Default to TMDB
-        typeis = typeis.lower().split()[0]
-        base_url = f'https://api.themoviedb.org/3/search/{typeis}'
+class TMDBProvider(MetadataProvider):
+    def search(self, name, search_type, year=None, region=None, **extra):
         params = {
-            'api_key': settings.api_key,
-            'query': movie_name,
+            'api_key': self.settings.api_key,
+            'query': name,
         }
+        params.update(extra)
         if year:
-            if typeis == 'movie':
+            if search_type == 'movie':
                 params['year'] = year
-            elif typeis == 'tv':
+            elif search_type == 'tv':
                 params['first_air_date_year'] = year
         if region:
             params['region'] = region.upper()
+        url = f'{TMDB_API_URL}/search/{search_type}'
+        return cached_get_json('search', url, params, is_negative=_no_results).get('results', [])
 
-        response = requests.get(base_url, params=params)
-        response.raise_for_status()
-        results = response.json().get('results', [])
+    def find_poster(self, name, media_type, year=None, region=None):
+        search_type = media_type.lower().split()[0]
+        results = self.search(name, search_type, year, region)
 
         if results:
-            title_key = 'title' if typeis == 'movie' else 'name'
+            title_key = 'title' if search_type == 'movie' else 'name'
             for result in results:
                 title = result.get(title_key, '').lower()
                 result_year = (result.get('release_date') or result.get('first_air_date') or '')[:4]
-                if title == movie_name.lower() and (not year or result_year == str(year)):
+                if title == name.lower() and (not year or result_year == str(year)):
                     poster_path = result.get('poster_path')
                     if poster_path:
-                        return f'https://image.tmdb.org/t/p/w500{poster_path}'
+                        return f'{TMDB_IMAGE_URL}{poster_path}'
             poster_path = results[0].get('poster_path')
             if poster_path:
-                return f'https://image.tmdb.org/t/p/w500{poster_path}'
-        print(f"[WARN] Poster not found for: {movie_name}")
+                return f'{TMDB_IMAGE_URL}{poster_path}'
+        print(f"[WARN] Poster not found for: {name}")
         return None
 
-def get_cached_poster(url, fallback_info=None):
-    os.makedirs(TEMP_FOLDER, exist_ok=True)
-    filename = hashlib.md5(url.encode()).hexdigest() + ".jpg"
-    filepath = os.path.join(TEMP_FOLDER, filename)
+    def find_trailer(self, name, media_type, year=None, region=None):
+        search_type = media_type.lower().split()[0]
+        results = self.search(name, search_type, year, region, include_adult=False)
+        if not results:
+            print(f"[INFO] No results found for: {name}")
+            # Try without region/year if initial search fails
+            results = self.search(name, search_type, include_adult=False)
+            if not results:
+                return None
+
+        # Improved exact matching
+        title_key = 'name' if search_type == 'tv' else 'title'
+        clean_name = re.sub(r'[^\w\s]', '', name.lower())
+
+        exact_match = None
+        for item in results:
+            item_title = re.sub(r'[^\w\s]', '', item.get(title_key, '').lower())
+            if item_title == clean_name:
+                exact_match = item
+                break
+
+        # Fallback to partial match if no exact match
+        item_id = None
+        if exact_match:
+            item_id = exact_match['id']
+        else:
+            for item in results:
+                item_title = item.get(title_key, '').lower()
+                if name.lower() in item_title:
+                    item_id = item['id']
+                    break
 
-    # Serve from cache if file exists
-    if os.path.exists(filepath):
-        return url_for('poster_file', filename=filename)
+        if not item_id:
+            item_id = results[0]['id'] if results else None
 
-    try:
-        # Try downloading and resizing the poster
-        response = requests.get(url, timeout=5)
+        if not item_id:
+            return None
+
+        video_url = f'{TMDB_API_URL}/{search_type}/{item_id}/videos'
+        video_res = cached_get_json('videos', video_url, {'api_key': self.settings.api_key}, is_negative=_no_results)
+
+        for vid in video_res.get('results', []):
+            if vid['type'] == 'Trailer' and vid['site'] == 'YouTube':
+                return {
+                    'trailer_url': f"https://www.youtube.com/embed/{vid['key']}",
+                    'tmdb_id': item_id,
+                    'trailer_key': vid['key'],
+                }
+        return {'trailer_url': None, 'tmdb_id': item_id, 'trailer_key': None}
+
+class OMDBProvider(MetadataProvider):
+    def find_poster(self, name, media_type, year=None, region=None):
+        params = {
+            'apikey': self.settings.api_key,
+            't': name,
+            'type': 'movie' if media_type.lower() == 'movie' else 'series',
+            'y': year
+        }
+        data = cached_get_json('omdb', OMDB_API_URL, params,
+                               is_negative=lambda d: d.get('Response') == 'False', check_status=False)
+        poster = data.get('Poster')
+        return poster if poster and poster != 'N/A' else None
+
+# A self-hosted or third party API configured through poster_api_url and
+# trailer_api_url. The URL is called with name, type, year, region and
+# api_key as query parameters (or as {name}-style placeholders in the URL)
+# and must answer with JSON like {"poster_url": "..."} / {"trailer_url": "..."}.
+class CustomProvider(MetadataProvider):
+    def _call(self, url_template, field, name, media_type, year, region):
+        values = {
+            'name': name,
+            'type': media_type,
+            'year': year or '',
+            'region': region or '',
+            'api_key': self.settings.api_key,
+        }
+        if '{' in url_template:
+            url = url_template.format(**{k: urllib.parse.quote(str(v)) for k, v in values.items()})
+            params = None
+        else:
+            url, params = url_template, values
+        data = cached_get_json('custom', url, params, is_negative=lambda d: not d.get(field))
+        return data.get(field)
+
+    def find_poster(self, name, media_type, year=None, region=None):
+        if not self.settings.poster_api_url:
+            return TMDBProvider(self.settings).find_poster(name, media_type, year, region)
+        return self._call(self.settings.poster_api_url, 'poster_url', name, media_type, year, region)
+
+    def find_trailer(self, name, media_type, year=None, region=None):
+        if not self.settings.trailer_api_url:
+            return TMDBProvider(self.settings).find_trailer(name, media_type, year, region)
+        trailer_url = self._call(self.settings.trailer_api_url, 'trailer_url', name, media_type, year, region)
+        return {'trailer_url': trailer_url, 'tmdb_id': None, 'trailer_key': None}
+
+PROVIDERS = {
+    'tmdb': TMDBProvider,
+    'omdb': OMDBProvider,
+    'custom': CustomProvider,
+}
+
+def register_provider(name, provider_class):
+    PROVIDERS[name] = provider_class
+
+def get_provider():
+    return PROVIDERS.get(app_settings.api_provider, TMDBProvider)(app_settings)
+
+# Modify get_movie_poster function
+def get_movie_poster(movie_name, typeis, year=None, region=None):
+    return get_provider().find_poster(movie_name, typeis, year, region)
+
+def find_trailer(name, media_type, year=None, region=None):
+    return get_provider().find_trailer(name, media_type, year, region)
+
+# Spaces out provider calls so a big page cannot trip the API rate limit
+class RateLimiter:
+    def __init__(self, rate):
+        self.rate = rate
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def acquire(self):
+        if not self.rate or self.rate <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + 1.0 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+
+# Resolves poster URLs for many titles at once on a thread pool.
+# Titles are deduplicated by key, and anything not done before the page
+# deadline keeps resolving in the background for /local_videos/posters.
+POSTER_RESULTS_MAX = 10000  # Remembered lookups, least recently used dropped first
+
+class PosterResolver:
+    def __init__(self, workers, rate):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="poster-resolver")
+        self.limiter = RateLimiter(rate)
+        self.lock = threading.Lock()
+        # key -> (poster url or None, expiry). Misses expire with the API
+        # cache's negative TTL so titles that show up later get found.
+        self.results = {}
+        self.pending = {}
+
+    def _result(self, key):
+        # Called with the lock held, returns (found, poster url)
+        result = self.results.pop(key, None)
+        if result is None or result[1] < time.time():
+            return False, None
+        self.results[key] = result
+        return True, result[0]
+
+    @staticmethod
+    def make_key(name, media_type, year=None):
+        return f"{media_type}|{name.lower()}|{year or ''}"
+
+    def submit(self, name, media_type, year=None):
+        key = self.make_key(name, media_type, year)
+        with self.lock:
+            if key not in self.pending and not self._result(key)[0]:
+                self.pending[key] = self.executor.submit(self._fetch, key, name, media_type, year)
+        return key
+
+    def _fetch(self, key, name, media_type, year):
+        self.limiter.acquire()
+        try:
+            poster_url = get_movie_poster(name, media_type, year)
+        except Exception as e:
+            print(f"[ERROR] Poster lookup failed for '{name}': {e}")
+            with self.lock:
+                # Not remembered, so the next page load retries it
+                self.pending.pop(key, None)
+            return None
+        ttl = API_CACHE_TTLS['search'] if poster_url else API_CACHE_NEGATIVE_TTL
+        with self.lock:
+            self.results.pop(key, None)
+            self.results[key] = (poster_url, time.time() + ttl)
+            while len(self.results) > POSTER_RESULTS_MAX:
+                del self.results[next(iter(self.results))]
+            self.pending.pop(key, None)
+        return poster_url
+
+    def resolve_many(self, titles, deadline):
+        # titles: iterable of (name, media_type, year), returns {key: poster_url or None}
+        keys = [self.submit(name, media_type, year) for name, media_type, year in titles]
+        with self.lock:
+            futures = [self.pending[key] for key in set(keys) if key in self.pending]
+        if futures:
+            wait(futures, timeout=deadline)
+        return self.lookup(keys)
+
+    def lookup(self, keys):
+        with self.lock:
+            return {
+                key: {'pending': key in self.pending, 'poster_url': self._result(key)[1]}
+                for key in keys
+            }
+
+poster_resolver = PosterResolver(app_settings.metadata_workers, app_settings.metadata_rate_limit)
+
+# Poster thumbnails are generated by a background worker pool so that
+# rendering a page never waits for an image download.
+THUMBNAIL_SIZE = (200, 300)  # Plain JPEG used as <img src> fallback
+THUMBNAIL_WIDTHS = (160, 240, 320, 480)  # Variants offered through srcset
+THUMBNAIL_FORMATS = tuple(fmt for fmt in ('avif', 'webp') if features.check(fmt))
+THUMBNAIL_FILE_RE = re.compile(r'^([0-9a-f]{32})(?:-\d+)?\.(?:jpg|webp|avif)$')
+THUMBNAIL_MAX_AGE = 365 * 24 * 3600
+THUMBNAIL_REQUEST_WAIT = 8  # Seconds /temp/<file> waits for a thumbnail being generated
+THUMBNAIL_RETRY_AFTER = 600  # Seconds before a failed thumbnail is tried again
+
+# Managed store behind the poster thumbnails. Pages keep addressing posters
+# by a hash of the source URL, but the files on disk are named after a hash
+# of the downloaded image, so the same artwork behind several URLs is kept
+# once. poster_cache.db maps URLs to images and records every file's size
+# and SHA-256. Sizes are checked on every serve and hashes on the first
+# serve of each file per run, so a damaged file gets regenerated instead of
+# being served (and cached by browsers for a year). Past poster_cache_max_bytes the least recently (lru)
+# or least often (lfu) served images are evicted.
+POSTER_CACHE_DB = "poster_cache.db"
+POSTER_ACCESS_FLUSH = 60  # Seconds between writes of access times and hit counts
+
+class PosterStore:
+    def __init__(self, db_path, folder, max_bytes, policy):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                content TEXT PRIMARY KEY,
+                files TEXT,
+                bytes INTEGER,
+                hits INTEGER,
+                last_access REAL
+            );
+            CREATE TABLE IF NOT EXISTS urls (
+                url_key TEXT PRIMARY KEY,
+                content TEXT
+            );
+        """)
+        self.conn.commit()
+        # Mirrors of both tables, lookups happen on every page render
+        self.urls = dict(self.conn.execute("SELECT url_key, content FROM urls"))
+        self.blobs = {
+            content: {'files': json.loads(files), 'bytes': size, 'hits': hits, 'last_access': last_access}
+            for content, files, size, hits, last_access in self.conn.execute(
+                "SELECT content, files, bytes, hits, last_access FROM blobs")
+        }
+        self.total_bytes = sum(blob['bytes'] for blob in self.blobs.values())
+        self.dirty = set()  # Blobs with access stats not yet written
+        self.verified = set()  # Files whose hash was checked in this run
+        self.last_flush = time.time()
+
+    @staticmethod
+    def content_key(data):
+        return hashlib.sha256(data).hexdigest()[:32]
+
+    def _file_digest(self, filename):
+        with open(os.path.join(self.folder, filename), 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def has(self, url_key):
+        with self.lock:
+            return self.urls.get(url_key) in self.blobs
+
+    def link(self, url_key, content):
+        with self.lock:
+            if content not in self.blobs:
+                return False
+            self.urls[url_key] = content
+            self.conn.execute("INSERT OR REPLACE INTO urls (url_key, content) VALUES (?, ?)", (url_key, content))
+            self.conn.commit()
+            return True
+
+    def add(self, url_key, content, filenames):
+        # filenames were written atomically to the folder already
+        files = {name: [os.path.getsize(os.path.join(self.folder, name)), self._file_digest(name)]
+                 for name in filenames}
+        size = sum(file_size for file_size, _ in files.values())
+        now = time.time()
+        with self.lock:
+            old = self.blobs.get(content)
+            if old:
+                self.total_bytes -= old['bytes']
+            self.blobs[content] = {'files': files, 'bytes': size, 'hits': 0, 'last_access': now}
+            self.urls[url_key] = content
+            self.total_bytes += size
+            self.verified.update(files)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO blobs (content, files, bytes, hits, last_access) VALUES (?, ?, ?, 0, ?)",
+                (content, json.dumps(files), size, now))
+            self.conn.execute("INSERT OR REPLACE INTO urls (url_key, content) VALUES (?, ?)", (url_key, content))
+            self.conn.commit()
+        self.evict()
+
+    def resolve(self, url_key, suffix):
+        # Disk filename for a URL-named file ("-240.webp" or ".jpg" suffix),
+        # None if unknown or failing the size check
+        with self.lock:
+            content = self.urls.get(url_key)
+            blob = self.blobs.get(content)
+            if not blob:
+                return None
+            filename = content + suffix
+            expected = blob['files'].get(filename)
+        if expected is None:
+            return None
+        try:
+            intact = os.path.getsize(os.path.join(self.folder, filename)) == expected[0]
+            if intact and filename not in self.verified:
+                intact = self._file_digest(filename) == expected[1]
+                if intact:
+                    self.verified.add(filename)
+        except OSError:
+            intact = False
+        if not intact:
+            print(f"[WARN] Poster {filename} is missing or damaged, regenerating")
+            self.drop(content)
+            return None
+        with self.lock:
+            blob['hits'] += 1
+            blob['last_access'] = time.time()
+            self.dirty.add(content)
+            flush = time.time() - self.last_flush > POSTER_ACCESS_FLUSH
+        if flush:
+            self.flush()
+        return filename
+
+    def flush(self):
+        with self.lock:
+            rows = [(self.blobs[c]['hits'], self.blobs[c]['last_access'], c) for c in self.dirty if c in self.blobs]
+            self.dirty.clear()
+            self.last_flush = time.time()
+            self.conn.executemany("UPDATE blobs SET hits = ?, last_access = ? WHERE content = ?", rows)
+            self.conn.commit()
+
+    def drop(self, content):
+        with self.lock:
+            blob = self.blobs.pop(content, None)
+            if not blob:
+                return 0
+            self.total_bytes -= blob['bytes']
+            for url_key in [k for k, c in self.urls.items() if c == content]:
+                del self.urls[url_key]
+            self.conn.execute("DELETE FROM blobs WHERE content = ?", (content,))
+            self.conn.execute("DELETE FROM urls WHERE content = ?", (content,))
+            self.conn.commit()
+        for filename in blob['files']:
+            self.verified.discard(filename)
+            try:
+                os.remove(os.path.join(self.folder, filename))
+            except OSError:
+                pass
+        return blob['bytes']
+
+    def evict(self):
+        with self.lock:
+            if self.total_bytes <= self.max_bytes:
+                return
+            if self.policy == 'lfu':
+                order = sorted(self.blobs, key=lambda c: (self.blobs[c]['hits'], self.blobs[c]['last_access']))
+            else:
+                order = sorted(self.blobs, key=lambda c: self.blobs[c]['last_access'])
+            excess = self.total_bytes - self.max_bytes
+        freed = 0
+        for content in order:
+            if freed >= excess:
+                break
+            freed += self.drop(content)
+            metrics.inc('myflixvault_poster_evictions_total')
+        print(f"[INFO] Evicted {freed // 1024} KB of posters to stay under the cache budget")
+
+    def verify(self):
+        # Startup check: drop images with missing, resized or unhashed files and delete
+        # files nothing refers to (partial writes, URL-named files from
+        # before the store existed)
+        known = set()
+        for content, blob in list(self.blobs.items()):
+            for filename, expected in blob['files'].items():
+                try:
+                    # Rows without a recorded hash can't be checked, they count as damaged
+                    intact = (isinstance(expected, list) and len(expected) == 2 and expected[1]
+                              and os.path.getsize(os.path.join(self.folder, filename)) == expected[0])
+                except OSError:
+                    intact = False
+                if not intact:
+                    self.drop(content)
+                    break
+            else:
+                known.update(blob['files'])
+        removed = 0
+        for filename in os.listdir(self.folder):
+            if filename.endswith('.part') or (THUMBNAIL_FILE_RE.match(filename) and filename not in known):
+                try:
+                    os.remove(os.path.join(self.folder, filename))
+                    removed += 1
+                except OSError:
+                    pass
+        if removed:
+            print(f"[INFO] Removed {removed} stray poster files")
+
+poster_store = PosterStore(POSTER_CACHE_DB, TEMP_FOLDER, int(app_settings.poster_cache_max_bytes),
+                           app_settings.poster_cache_policy)
+atexit.register(poster_store.flush)
+metrics.describe('myflixvault_poster_evictions_total', 'counter', 'Poster images evicted from the disk cache')
+
+class ThumbnailWorker:
+    def __init__(self, workers):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumbnail")
+        self.lock = threading.Lock()
+        self.sources = {}  # filename -> (poster url, fallback info)
+        self.jobs = {}
+        self.failed = {}
+
+    @staticmethod
+    def filename_for(url):
+        return hashlib.md5(url.encode()).hexdigest() + ".jpg"
+
+    def register(self, url, fallback_info=None):
+        filename = self.filename_for(url)
+        with self.lock:
+            self.sources[filename] = (url, fallback_info)
+        return filename
+
+    def enqueue(self, filename):
+        with self.lock:
+            if filename not in self.sources:
+                return None
+            job = self.jobs.get(filename)
+            if job:
+                return job
+            if time.time() - self.failed.get(filename, 0) < THUMBNAIL_RETRY_AFTER:
+                return None
+            job = self.jobs[filename] = self.executor.submit(self._generate, filename)
+        job.add_done_callback(lambda _: self._finish(filename))
+        return job
+
+    @staticmethod
+    def variant_name(filename, width, fmt):
+        return f"{os.path.splitext(filename)[0]}-{width}.{fmt}"
+
+    def is_complete(self, filename):
+        return poster_store.has(os.path.splitext(filename)[0])
+
+    @staticmethod
+    def _save(img, filepath, fmt):
+        # Write next to the target and rename, so /temp never serves a half-written
+        # file. Unique temp names, two URLs may be saving the same artwork at once.
+        tmp_path = f"{filepath}.{uuid.uuid4().hex[:8]}.part"
+        img.save(tmp_path, format=fmt)
+        os.replace(tmp_path, filepath)
+
+    def _download(self, url, url_key):
+        response = provider_http.get(url)
         response.raise_for_status()
 
+        # Artwork already stored for another URL only needs linking
+        content = poster_store.content_key(response.content)
+        if poster_store.link(url_key, content):
+            return
+
+        # Decode once and scale down step by step, largest variant first
         img = Image.open(BytesIO(response.content))
-        img.thumbnail((200, 300))  # Resize to small
-        img.save(filepath, format="JPEG")
-        return url_for('poster_file', filename=filename)
+        img = img.convert('RGB')
+        filename = content + ".jpg"
+        written = []
+        current = img
+        for width in sorted(THUMBNAIL_WIDTHS, reverse=True):
+            current = current.copy()
+            current.thumbnail((width, width * 3 // 2))
+            for fmt in THUMBNAIL_FORMATS:
+                written.append(self.variant_name(filename, width, fmt))
+                self._save(current, os.path.join(TEMP_FOLDER, written[-1]), fmt.upper())
+
+        img.thumbnail(THUMBNAIL_SIZE)  # Resize to small
+        self._save(img, os.path.join(TEMP_FOLDER, filename), "JPEG")
+        poster_store.add(url_key, content, written + [filename])
+
+    def _generate(self, filename):
+        started = time.monotonic()
+        generated = self._generate_files(filename)
+        metrics.observe('myflixvault_thumbnail_seconds', time.monotonic() - started,
+                        result='ok' if generated else 'failed')
+        return generated
+
+    def _generate_files(self, filename):
+        url, fallback_info = self.sources[filename]
+        url_key = os.path.splitext(filename)[0]
+        try:
+            self._download(url, url_key)
+            return True
+        except Exception as e:
+            print(f"[ERROR] Failed to fetch/save poster: {e}")
 
-    except Exception as e:
-        print(f"[ERROR] Failed to fetch/save poster: {e}")
+        try:
+            # If fallback_info is available, try to regenerate poster
+            if fallback_info and fallback_info.get('name'):
+                name = fallback_info.get('name')
+                new_url = get_movie_poster(name, fallback_info.get('type') or 'movie',
+                                           year=fallback_info.get('year'), region=fallback_info.get('country'))
+                if new_url and new_url != url:
+                    print(f"[INFO] Regenerating poster for '{name}'")
+                    self._download(new_url, url_key)
+                    return True
+        except Exception as e:
+            print(f"[ERROR] Failed to regenerate poster: {e}")
 
-        # If fallback_info is available, try to regenerate poster
-        if fallback_info:
-            name = fallback_info.get('name')
-            media_type = fallback_info.get('type')
-            year = fallback_info.get('year')
-            country = fallback_info.get('country')
+        with self.lock:
+            self.failed[filename] = time.time()
+        return False
 
-            new_url = get_movie_poster(name, media_type, year=year, region=country)
-            if new_url and new_url != url:
-                print(f"[INFO] Regenerating poster for '{name}'")
-                return get_cached_poster(new_url, fallback_info=fallback_info)
+    def _finish(self, filename):
+        with self.lock:
+            self.jobs.pop(filename, None)
 
-    # Final fallback to original URL
-    return url
+thumbnail_worker = ThumbnailWorker(4)
+
+def get_cached_poster(url, fallback_info=None):
+    # Only ever returns a URL, a missing thumbnail is queued and /temp/<file>
+    # generates it or serves a placeholder.
+    filename = thumbnail_worker.register(url, fallback_info)
+    if thumbnail_worker.is_complete(filename):
+        metrics.inc('myflixvault_poster_cache_total', result='hit')
+    else:
+        metrics.inc('myflixvault_poster_cache_total', result='miss')
+        thumbnail_worker.enqueue(filename)
+    return url_for('poster_file', filename=filename)
+
+def get_poster_srcset(url, fmt, fallback_info=None):
+    filename = thumbnail_worker.register(url, fallback_info)
+    return ", ".join(
+        f"{url_for('poster_file', filename=thumbnail_worker.variant_name(filename, width, fmt))} {width}w"
+        for width in THUMBNAIL_WIDTHS
+    )
 
 @app.route('/temp/<path:filename>')
 def poster_file(filename):
-    return send_from_directory(TEMP_FOLDER, filename)
+    match = THUMBNAIL_FILE_RE.match(filename)
+    if not match:
+        return "Not found", 404
+    url_key = match.group(1)
+    suffix = filename[len(url_key):]
+    stored = poster_store.resolve(url_key, suffix)
+    if not stored:
+        job = thumbnail_worker.enqueue(url_key + ".jpg")
+        if job:
+            wait([job], timeout=THUMBNAIL_REQUEST_WAIT)
+        stored = poster_store.resolve(url_key, suffix)
+        if not stored:
+            response = send_from_directory(app.static_folder, 'poster-placeholder.svg')
+            response.headers['Cache-Control'] = 'no-store'
+            return response
+
+    # Thumbnails never change for a given source URL, so browsers can keep them
+    response = send_from_directory(TEMP_FOLDER, stored, max_age=THUMBNAIL_MAX_AGE)
+    response.headers['Cache-Control'] = f'public, max-age={THUMBNAIL_MAX_AGE}, immutable'
+    return response
 
 @app.context_processor
 def inject_helpers():
     def get_poster_safe(item):
         return get_cached_poster(item['poster_url'], fallback_info=item)
-    return {'get_poster': get_poster_safe}
-
-def load_data():
-    if not os.path.exists(JSON_FILE):
-        return {"series": [], "movies": []}
-    with open(JSON_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def save_data(data):
-    with open(JSON_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    def get_poster_srcset_safe(item, fmt):
+        return get_poster_srcset(item['poster_url'], fmt, fallback_info=item)
+    return {
+        'is_local': lambda item: match_index.has(item.get('id')),
+        'get_poster': get_poster_safe,
+        'get_poster_srcset': get_poster_srcset_safe,
+        'poster_formats': THUMBNAIL_FORMATS,
+        'poster_sizes': "(max-width: 600px) 45vw, 240px",
+    }
+
+# The collection is parsed once and kept in memory. Every mutation is
+# appended to a journal (one JSON line per operation) and the full
+# my_list.json snapshot is only rewritten when the journal is compacted.
+JOURNAL_COMPACT_INTERVAL = 60  # Seconds between background compactions
+JOURNAL_COMPACT_OPS = 1000  # Compact right away once the journal gets this long
+
+def new_entry_id():
+    return uuid.uuid4().hex[:12]
+
+class CollectionStore:
+    def __init__(self, path, journal_path):
+        self.path = path
+        self.journal_path = journal_path
+        self.lock = threading.RLock()
+        self.version = 0  # Bumped on every add/edit/delete
+        self.membership_version = 0  # Bumped on every add/delete
+        self.field_versions = defaultdict(int)  # field -> edits of that field
+        self.data = {}  # category -> {id: entry}, in collection order
+        self.by_id = {}  # id -> category
+        self.by_key = defaultdict(set)  # (name, year, type) -> ids, for duplicate detection
+        self.sort_keys = {}  # id -> insertion number, kept after a delete for page cursors
+        self.sequence = itertools.count()
+        self.ids_assigned = False
+        self.journal_torn = False
+        entries, self.snapshot_digest = self._load_snapshot()
+        for category, items in entries.items():
+            self.data.setdefault(category, {})
+            for entry in items:
+                if not entry.get('id'):
+                    entry['id'] = new_entry_id()
+                    self.ids_assigned = True
+                self._insert(category, entry)
+        self.journal_ops = self._replay_journal()
+        if self.journal_ops is None:
+            # Missing journal, or one that was already folded into the snapshot
+            self._reset_journal()
+        else:
+            self.journal = open(self.journal_path, 'a', encoding='utf-8')
+        if self.ids_assigned or self.journal_torn:
+            # Persist the ids handed out to entries from an older my_list.json,
+            # or fold a journal ending in a torn line into a fresh snapshot so
+            # new writes aren't appended after the broken bytes
+            self.compact(force=True)
+
+    def _load_snapshot(self):
+        if not os.path.exists(self.path):
+            return {"series": [], "movies": []}, hashlib.sha1(b"").hexdigest()
+        with open(self.path, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw.decode('utf-8'))
+        data.setdefault("series", [])
+        data.setdefault("movies", [])
+        return data, hashlib.sha1(raw).hexdigest()
+
+    def _replay_journal(self):
+        # The first journal line names the snapshot it applies to. If that's
+        # not the current snapshot, a compaction finished writing the new
+        # snapshot but crashed before it could reset the journal.
+        if not os.path.exists(self.journal_path):
+            return None
+        count = 0
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    op = json.loads(line)
+                except ValueError:
+                    # A torn last line from a crash, everything before it is intact
+                    print(f"[WARN] Ignoring incomplete journal entry in {self.journal_path}")
+                    self.journal_torn = True
+                    break
+                if not line.endswith("\n"):
+                    # Complete, but the next append would be glued onto it
+                    self.journal_torn = True
+                if op['op'] == 'base':
+                    if op['snapshot'] != self.snapshot_digest:
+                        return None
+                    continue
+                if op['op'] == 'add' and not op['entry'].get('id'):
+                    op['entry']['id'] = new_entry_id()
+                    self.ids_assigned = True
+                self._apply(op)
+                count += 1
+        return count
+
+    def _reset_journal(self):
+        if getattr(self, 'journal', None):
+            self.journal.close()
+        tmp_path = self.journal_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'op': 'base', 'snapshot': self.snapshot_digest}) + "\n")
+        os.replace(tmp_path, self.journal_path)
+        self.journal = open(self.journal_path, 'a', encoding='utf-8')
+        self.journal_ops = 0
+
+    @staticmethod
+    def entry_key(entry):
+        return (
+            (entry.get('name') or '').strip().lower(),
+            (entry.get('year') or '').strip(),
+            (entry.get('type') or '').strip().lower(),
+        )
+
+    def _insert(self, category, entry):
+        self.data.setdefault(category, {})[entry['id']] = entry
+        self.by_id[entry['id']] = category
+        self.by_key[self.entry_key(entry)].add(entry['id'])
+        self.sort_keys[entry['id']] = next(self.sequence)
+
+    def _remove(self, entry_id):
+        category = self.by_id.pop(entry_id)
+        entry = self.data[category].pop(entry_id)
+        key = self.entry_key(entry)
+        self.by_key[key].discard(entry_id)
+        if not self.by_key[key]:
+            del self.by_key[key]
+        return category, entry
+
+    def _apply(self, op):
+        if op['op'] == 'add':
+            self._insert(op['category'], op['entry'])
+        elif op['op'] == 'update':
+            # Updated in place so the entry keeps its position, only the key index moves
+            entry = self.data[self.by_id[op['id']]][op['id']]
+            old_key = self.entry_key(entry)
+            entry.update(op['fields'])
+            self.by_key[old_key].discard(op['id'])
+            if not self.by_key[old_key]:
+                del self.by_key[old_key]
+            self.by_key[self.entry_key(entry)].add(op['id'])
+        elif op['op'] == 'delete':
+            self._remove(op['id'])
+
+    def _commit(self, op):
+        self._apply(op)
+        self.journal.write(json.dumps(op, ensure_ascii=False) + "\n")
+        self.journal.flush()
+        self.journal_ops += 1
+        self.version += 1
+        if op['op'] == 'update':
+            for field in op['fields']:
+                self.field_versions[field] += 1
+        else:
+            self.membership_version += 1
+        if self.journal_ops >= JOURNAL_COMPACT_OPS:
+            self.compact()
+
+    def fields_version(self, fields):
+        # Only changes when entries are added or removed or one of fields is
+        # edited, indexes over a few fields skip trailer and poster updates.
+        # Entries are updated in place, so the indexes still hand out
+        # current data.
+        with self.lock:
+            return (self.membership_version,) + tuple(self.field_versions[field] for field in fields)
+
+    def items(self, category):
+        with self.lock:
+            return list(self.data.get(category, {}).values())
+
+    def sort_key(self, entry_id):
+        # Increases in collection order, None for ids this process never saw
+        with self.lock:
+            return self.sort_keys.get(entry_id)
+
+    def get(self, entry_id):
+        # Returns (category, copy of the entry) or None
+        with self.lock:
+            category = self.by_id.get(entry_id)
+            if category is None:
+                return None
+            return category, dict(self.data[category][entry_id])
+
+    def find(self, category, name, year, media_type):
+        with self.lock:
+            key = self.entry_key({'name': name, 'year': year, 'type': media_type})
+            for entry_id in self.by_key.get(key, ()):
+                if self.by_id[entry_id] == category:
+                    return entry_id
+            return None
+
+    def add(self, category, entry, entry_id=None):
+        # entry_id keeps the id of an imported entry, it must not be taken
+        with self.lock:
+            if entry_id in self.by_id:
+                raise ValueError(f"Entry id {entry_id} is already taken")
+            entry = dict(entry, id=entry_id or new_entry_id())
+            self._commit({'op': 'add', 'category': category, 'entry': entry})
+            return entry['id']
+
+    def update(self, entry_id, fields):
+        with self.lock:
+            if entry_id not in self.by_id:
+                return False
+            fields = {k: v for k, v in fields.items() if k != 'id'}
+            self._commit({'op': 'update', 'id': entry_id, 'fields': fields})
+            return True
+
+    def delete(self, entry_id):
+        with self.lock:
+            if entry_id not in self.by_id:
+                return False
+            self._commit({'op': 'delete', 'id': entry_id})
+            return True
+
+    def compact(self, force=False):
+        # Write a fresh snapshot atomically, then start an empty journal
+        with self.lock:
+            if not self.journal_ops and not force:
+                return
+            data = {category: list(items.values()) for category, items in self.data.items()}
+            raw = json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self.snapshot_digest = hashlib.sha1(raw).hexdigest()
+            self._reset_journal()
+
+collection = CollectionStore(JSON_FILE, JOURNAL_FILE)
+atexit.register(collection.compact)
+
+def collection_compactor():
+    while True:
+        time.sleep(JOURNAL_COMPACT_INTERVAL)
+        try:
+            collection.compact()
+        except Exception as e:
+            print(f"[ERROR] Compacting {JSON_FILE} failed: {e}")
+
+# Token index over the collection for the index page search. It is rebuilt
+# lazily the first time it's queried after the collection changes.
+SEARCH_FIELDS = ('name', 'year', 'country', 'type', 'condition')
+PAGE_SIZE = 60
+
+def tokenize(text):
+    return re.findall(r'\w+', str(text or '').casefold())
+
+class SearchIndex:
+    def __init__(self, store):
+        self.store = store
+        self.lock = threading.Lock()
+        self.version = None
+        self.categories = {}
+
+    def _build(self):
+        categories = {}
+        for category in ('series', 'movies'):
+            items = self.store.items(category)
+            keys = [self.store.sort_key(item['id']) for item in items]
+            postings = defaultdict(set)
+            for position, item in enumerate(items):
+                for field in SEARCH_FIELDS:
+                    for token in tokenize(item.get(field)):
+                        postings[token].add(position)
+            categories[category] = (items, keys, postings, sorted(postings))
+        return categories
+
+    def _snapshot(self, category):
+        with self.lock:
+            version = self.store.fields_version(SEARCH_FIELDS)
+            if version != self.version:
+                self.categories = self._build()
+                self.version = version
+            return self.categories.get(category, ([], [], {}, []))
+
+    @staticmethod
+    def _match_token(token, postings, vocabulary):
+        # Prefix match first, fall back to close spellings
+        positions = set()
+        start = bisect.bisect_left(vocabulary, token)
+        for word in itertools.takewhile(lambda w: w.startswith(token), vocabulary[start:]):
+            positions |= postings[word]
+        if not positions:
+            for word in difflib.get_close_matches(token, vocabulary, n=5, cutoff=0.75):
+                positions |= postings[word]
+        return positions
+
+    def search(self, category, query='', condition=None):
+        # Returns [(sort key, item)] in collection order
+        items, keys, postings, vocabulary = self._snapshot(category)
+        matches = None
+        for token in tokenize(query):
+            positions = self._match_token(token, postings, vocabulary)
+            matches = positions if matches is None else matches & positions
+            if not matches:
+                break
+        if matches is None and query.strip():
+            # Nothing but punctuation or symbols, match it as typed
+            needle = query.strip().casefold()
+            matches = {i for i, item in enumerate(items) if needle in (item.get('name') or '').casefold()}
+        positions = range(len(items)) if matches is None else sorted(matches)
+
+        results = [(keys[position], items[position]) for position in positions]
+        if condition and condition != 'all':
+            results = [(p, item) for p, item in results if (item.get('condition') or '').lower() == condition]
+        return results
+
+search_index = SearchIndex(collection)
+
+def get_page(category, query='', condition=None, cursor=None, limit=PAGE_SIZE):
+    # The cursor is the id of the last item already sent. Its sort key
+    # outlives the entry, so pages stay consistent even if entries are added
+    # or deleted in between.
+    results = search_index.search(category, query, condition)
+    start = 0
+    key = collection.sort_key(cursor) if cursor else None
+    if key is not None:
+        start = bisect.bisect_right([key for key, _ in results], key)
+    page = results[start:start + limit]
+    next_cursor = page[-1][1]['id'] if start + limit < len(results) else None
+    return page, next_cursor, len(results)
+
+# Rendered pages of cards, reused until the collection (the cards) or the
+# local library (their Local badges) changes. Both counters make up the
+# content version, a fragment from an older version is never served.
+FRAGMENT_CACHE_SIZE = 256  # Cached (tab, query, condition, cursor) pages
+# Both counters start at 0 in every process, and the collection may have
+# been edited offline (python main.py import) in between, so ETags built on
+# them also carry an id of this run
+BOOT_ID = uuid.uuid4().hex[:12]
+
+def content_version():
+    return f"{BOOT_ID}.{collection.version}.{library_index.generation}"
+
+class FragmentCache:
+    def __init__(self, size):
+        self.size = size
+        self.lock = threading.Lock()
+        self.version = None
+        self.entries = {}  # key -> fragment, least recently used first
+
+    def get(self, key, render):
+        version = content_version()
+        with self.lock:
+            if version != self.version:
+                self.version = version
+                self.entries = {}
+            fragment = self.entries.pop(key, None)
+            if fragment is not None:
+                self.entries[key] = fragment
+        if fragment is not None:
+            metrics.inc('myflixvault_fragment_cache_total', result='hit')
+            return fragment
+        metrics.inc('myflixvault_fragment_cache_total', result='miss')
+        fragment = render()
+        with self.lock:
+            # Rendered from a version that changed meanwhile, don't keep it
+            if self.version == version:
+                self.entries[key] = fragment
+                while len(self.entries) > self.size:
+                    del self.entries[next(iter(self.entries))]
+        return fragment
+
+card_fragments = FragmentCache(FRAGMENT_CACHE_SIZE)
+metrics.describe('myflixvault_fragment_cache_total', 'counter', 'Card page renders served from or added to the fragment cache')
+
+def card_page(active_tab, query, condition, cursor=None, limit=PAGE_SIZE):
+    def render():
+        category = 'series' if active_tab == 'series' else 'movies'
+        items, next_cursor, total = get_page(category, query, condition, cursor, limit)
+        return {
+            "items": [dict(item, index=index) for index, item in items],
+            "html": render_template('_cards.html', items=items, active_tab=active_tab, query=query),
+            "next_cursor": next_cursor,
+            "total": total,
+        }
+    return card_fragments.get((active_tab, query, condition, cursor, limit), render)
+
+# Which local files belong to which collection entry, rebuilt once when
+# either the library or the collection changes. Local titles are indexed by
+# word; an entry matches the titles holding all of its words, preferring the
+# exact title, the right kind (series/movie), the entry's season and the
+# fewest extra words. Movies with a different year never match. Titles that
+# only differ in spacing or punctuation ("Spider-Man" and "Spiderman") fall
+# back to character trigrams of the squashed title.
+MATCH_MIN_TOKEN_SHARE = 0.5  # Entry words / local title words for a word match
+MATCH_MIN_TRIGRAM_SIMILARITY = 0.8  # Dice coefficient for the trigram fallback
+MATCH_FIELDS = ('name', 'year', 'ep')  # Entry fields a match depends on
+
+def trigrams(text):
+    text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class MatchIndex:
+    def __init__(self, store, library, episodes):
+        self.store = store
+        self.library = library
+        self.episodes = episodes
+        self.lock = threading.Lock()
+        self.version = None
+        self.matches = {}  # entry id -> local title
+
+    def _local_titles(self):
+        # Series from the episode index, everything else grouped by title and year
+        titles = []
+        for record in self.episodes.all_series():
+            titles.append({'kind': 'series', 'name': record['name'], 'year': None, 'series': record['key'],
+                           'seasons': set(record['seasons']),
+                           'files': [episode['path'] for episode in record['episodes']]})
+        movies = {}
+        for row in self.library.files():
+            info = row['info']
+            if not info['name'] or self.episodes.is_episode(row['path']):
+                continue
+            key = (normalize_title(info['name']), info.get('year'))
+            if key not in movies:
+                movies[key] = {'kind': 'movie', 'name': info['name'], 'year': info.get('year'),
+                               'series': None, 'seasons': set(), 'files': []}
+                titles.append(movies[key])
+            movies[key]['files'].append(row['path'])
+        for title in titles:
+            title['tokens'] = set(tokenize(title['name']))
+            title['compact'] = normalize_title(title['name'])
+            title['trigrams'] = trigrams(title['compact'])
+        return titles
+
+    def _build(self):
+        titles = self._local_titles()
+        postings = defaultdict(set)
+        gram_postings = defaultdict(set)
+        for position, title in enumerate(titles):
+            for token in title['tokens']:
+                postings[token].add(position)
+            for gram in title['trigrams']:
+                gram_postings[gram].add(position)
+
+        matches = {}
+        for category in ('series', 'movies'):
+            for entry in self.store.items(category):
+                best = self._best_match(entry, category, titles, postings, gram_postings)
+                if best is not None:
+                    matches[entry['id']] = titles[best]
+        return matches
+
+    @staticmethod
+    def _best_match(entry, category, titles, postings, gram_postings):
+        tokens = set(tokenize(entry.get('name')))
+        compact = normalize_title(entry.get('name') or '')
+        if not compact:
+            return None
+        candidates = set.intersection(*(postings.get(token, set()) for token in tokens))
+        candidates = {i for i in candidates if len(tokens) / len(titles[i]['tokens']) >= MATCH_MIN_TOKEN_SHARE}
+        if not candidates:
+            entry_grams = trigrams(compact)
+            shared = defaultdict(int)
+            for gram in entry_grams:
+                for i in gram_postings.get(gram, ()):
+                    shared[i] += 1
+            candidates = {
+                i for i, count in shared.items()
+                if 2 * count / (len(entry_grams) + len(titles[i]['trigrams'])) >= MATCH_MIN_TRIGRAM_SIMILARITY
+            }
+
+        year = str(entry.get('year') or '')
+        if year:
+            candidates = {i for i in candidates
+                          if titles[i]['kind'] == 'series' or not titles[i]['year'] or titles[i]['year'] == year}
+        if not candidates:
+            return None
+        kind = 'series' if category == 'series' else 'movie'
+        ref = parse_episode_ref(entry.get('ep')) if category == 'series' else None
+        season = ref[0] if ref else None
+
+        def rank(i):
+            title = titles[i]
+            return (
+                title['compact'] != compact,
+                title['kind'] != kind,
+                season is not None and season not in title['seasons'],
+                len(title['tokens'] - tokens),
+                title['name'],
+            )
+        return min(candidates, key=rank)
+
+    def _snapshot(self):
+        with self.lock:
+            version = (self.library.generation, self.store.fields_version(MATCH_FIELDS))
+            if version != self.version:
+                self.matches = self._build()
+                self.version = version
+            return self.matches
+
+    def get(self, entry_id):
+        return self._snapshot().get(entry_id)
+
+    def has(self, entry_id):
+        return entry_id in self._snapshot()
+
+match_index = MatchIndex(collection, library_index, episode_index)
+
+# Trailers are resolved ahead of time and stored on the entries themselves
+# (trailer_url, tmdb_id, trailer_key, trailer_checked), so opening a card
+# needs no provider calls. New and edited entries are queued right away and
+# a background pass re-checks stale ones.
+TRAILER_REFRESH_INTERVAL = 3600  # Seconds between passes over the collection
+TRAILER_MAX_AGE = 30 * 24 * 3600  # Re-check found trailers after this long
+TRAILER_MISSING_MAX_AGE = 3 * 24 * 3600  # Retry titles without a trailer sooner
+TRAILER_FIELDS = ('trailer_url', 'tmdb_id', 'trailer_key', 'trailer_checked')
+
+def trailer_identity(category, entry):
+    media_type = 'tv' if category == 'series' else 'movie'
+    return entry.get('name'), media_type, entry.get('year'), entry.get('country')
+
+class TrailerPrefetcher:
+    def __init__(self, store, workers):
+        self.store = store
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trailer-prefetch")
+        self.lock = threading.Lock()
+        self.pending = set()
+
+    def enqueue(self, entry_id):
+        with self.lock:
+            if entry_id in self.pending:
+                return
+            self.pending.add(entry_id)
+        self.executor.submit(self.resolve, entry_id)
+
+    def is_pending(self, entry_id):
+        with self.lock:
+            return entry_id in self.pending
+
+    def resolve(self, entry_id):
+        try:
+            found = self.store.get(entry_id)
+            if not found:
+                return
+            identity = trailer_identity(*found)
+            poster_resolver.limiter.acquire()
+            try:
+                trailer = find_trailer(*identity) or {}
+            except Exception as e:
+                # Left unchecked, so the next refresher pass tries again
+                print(f"[ERROR] Prefetching trailer for '{identity[0]}' failed: {e}")
+                return
+
+            # Don't store a trailer for a title that was renamed meanwhile
+            current = self.store.get(entry_id)
+            if current and trailer_identity(*current) == identity:
+                self.store.update(entry_id, {
+                    'trailer_url': trailer.get('trailer_url'),
+                    'tmdb_id': trailer.get('tmdb_id'),
+                    'trailer_key': trailer.get('trailer_key'),
+                    'trailer_checked': int(time.time()),
+                })
+        finally:
+            with self.lock:
+                self.pending.discard(entry_id)
+
+    @staticmethod
+    def is_stale(entry, now):
+        checked = entry.get('trailer_checked')
+        if not checked:
+            return True
+        max_age = TRAILER_MAX_AGE if entry.get('trailer_url') else TRAILER_MISSING_MAX_AGE
+        return now - checked > max_age
+
+    def refresh_stale(self):
+        now = time.time()
+        for category in ('series', 'movies'):
+            for entry in self.store.items(category):
+                if self.is_stale(entry, now):
+                    self.enqueue(entry['id'])
+
+trailer_prefetcher = TrailerPrefetcher(collection, 2)
+
+def trailer_refresher():
+    while True:
+        try:
+            trailer_prefetcher.refresh_stale()
+        except Exception as e:
+            print(f"[ERROR] Trailer refresh failed: {e}")
+        time.sleep(TRAILER_REFRESH_INTERVAL)
+
+POSTER_WARM_BATCH = 32  # Thumbnails queued at a time by the startup warm-up
+
+def warm_posters():
+    # Generate every collection poster once, so the first page loads don't
+    # wait on downloads. Stops at the cache budget instead of evicting what
+    # it just made.
+    entries = [item for category in ('series', 'movies') for item in collection.items(category)]
+    pending = []
+    for item in entries:
+        if poster_store.total_bytes >= poster_store.max_bytes:
+            print("[WARN] Poster cache budget reached, stopping warm-up")
+            break
+        if not item.get('poster_url'):
+            continue
+        filename = thumbnail_worker.register(item['poster_url'], item)
+        if thumbnail_worker.is_complete(filename):
+            continue
+        job = thumbnail_worker.enqueue(filename)
+        if job:
+            pending.append(job)
+        if len(pending) >= POSTER_WARM_BATCH:
+            wait(pending)
+            pending = []
+    wait(pending)
+
+def poster_warmer():
+    time.sleep(5)
+    try:
+        warm_posters()
+    except Exception as e:
+        print(f"[ERROR] Poster warm-up failed: {e}")
 
 @app.route('/')
 def index():
     active_tab = request.args.get('tab', 'series')
     query = request.args.get('q', '').lower()
-    data = load_data()
-    if active_tab == 'series':
-        items = data.get('series', [])
-    else:
-        items = data.get('movies', [])
-    if query:
-        query = query.lower()
-        filtered_items = [item for item in items if query in item['name'].lower()]
-    else:
-        filtered_items = items
+    condition = request.args.get('condition', 'all').lower()
+    cached = client_etag(version_etag('index', active_tab, query, condition))
+    if cached:
+        return not_modified(cached)
+    page = card_page(active_tab, query, condition)
     return render_template('index.html', 
-                          items=filtered_items,
+                          cards_html=page['html'],
+                          next_cursor=page['next_cursor'],
+                          total=page['total'],
                           active_tab=active_tab,
                           query=query,
+                          condition=condition,
                           show_local_videos=True)
 
+# Paginated search used by the index page for infinite scrolling
+@app.route('/api/items')
+def api_items():
+    active_tab = request.args.get('tab', 'series')
+    query = request.args.get('q', '').lower()
+    condition = request.args.get('condition', 'all').lower()
+    cursor = request.args.get('cursor') or None
+    limit = min(request.args.get('limit', PAGE_SIZE, type=int), 500)
+
+    cached = client_etag(version_etag('api_items', active_tab, query, condition, cursor, limit))
+    if cached:
+        return not_modified(cached)
+    return jsonify(card_page(active_tab, query, condition, cursor, limit))
+
 @app.route('/add', methods=['GET', 'POST'])
 def add_entry():
     if request.method == 'POST':
-        data = load_data()
         category = request.form['category']
         tab = request.form.get('tab', 'series')
         query = request.form.get('q', '')
@@ -248,6 +2364,11 @@ def add_entry():
         ep = request.form.get('ep', '') if category == 'series' else ''
         condition = request.form.get('condition', '') if category == 'series' else ''
 
+        # Already in the collection, open it for editing instead of adding a duplicate
+        existing_id = collection.find(category, name, year, media_type)
+        if existing_id:
+            return redirect(url_for('edit_entry', category=category, entry_id=existing_id, tab=tab, q=query))
+
         query_str = f"{name}"
         poster_url = request.form.get('poster_url') or get_movie_poster(query_str, media_type, year, region=country)
 
@@ -263,57 +2384,61 @@ def add_entry():
             new_entry["ep"] = ep
             new_entry["condition"] = condition
 
-        data[category].append(new_entry)
-        save_data(data)
+        entry_id = collection.add(category, new_entry)
+        trailer_prefetcher.enqueue(entry_id)
         return redirect(url_for('index', tab=tab, q=query))
 
     tab = request.args.get('tab', 'series')
     query = request.args.get('q', '')
     return render_template('add_edit.html', action='Add', tab=tab, q=query, item={})
 
-@app.route('/edit/<category>/<int:index>', methods=['GET', 'POST'])
-def edit_entry(category, index):
-    data = load_data()
-    items = data.get(category, [])
+@app.route('/edit/<category>/<entry_id>', methods=['GET', 'POST'])
+def edit_entry(category, entry_id):
+    found = collection.get(entry_id)
 
-    if index >= len(items):
+    if found is None or found[0] != category:
         return redirect(url_for('index'))
-
-    item = items[index]
+    item = found[1]
 
     if request.method == 'POST':
         tab = request.form.get('tab', 'series')
         query = request.form.get('q', '')
 
-        item['name'] = request.form['name']
-        item['year'] = request.form['year']
-        item['country'] = request.form['country']
-        item['type'] = request.form['type']
-        item['poster_url'] = request.form.get('poster_url', '')
+        fields = {
+            'name': request.form['name'],
+            'year': request.form['year'],
+            'country': request.form['country'],
+            'type': request.form['type'],
+            'poster_url': request.form.get('poster_url', ''),
+        }
 
         if category == 'series':
-            item['ep'] = request.form.get('ep', '')
-            item['condition'] = request.form.get('condition', '')
+            fields['ep'] = request.form.get('ep', '')
+            fields['condition'] = request.form.get('condition', '')
 
         if 'regenerate_poster' in request.form:
-            query_str = f"{item['name']}"
-            item['poster_url'] = get_movie_poster(query_str, item['type'], item['year'], region=item['country']) or item['poster_url']
+            query_str = f"{fields['name']}"
+            fields['poster_url'] = get_movie_poster(query_str, fields['type'], fields['year'], region=fields['country']) or fields['poster_url']
+
+        # A different title means a different trailer
+        renamed = trailer_identity(category, item) != trailer_identity(category, dict(item, **fields))
+        if renamed:
+            fields.update({field: None for field in TRAILER_FIELDS})
 
-        save_data(data)
+        collection.update(entry_id, fields)
+        if renamed:
+            trailer_prefetcher.enqueue(entry_id)
         return redirect(url_for('index', tab=tab, q=query))
 
     tab = request.args.get('tab', 'series')
     query = request.args.get('q', '')
     return render_template('add_edit.html', action='Edit', item=item, tab=tab, q=query)
 
-@app.route('/delete/<category>/<int:index>')
-def delete_entry(category, index):
-    data = load_data()
-    items = data.get(category, [])
-
-    if index < len(items):
-        del items[index]
-        save_data(data)
+@app.route('/delete/<category>/<entry_id>')
+def delete_entry(category, entry_id):
+    found = collection.get(entry_id)
+    if found and found[0] == category:
+        collection.delete(entry_id)
 
     tab = request.args.get('tab', 'series')
     query = request.args.get('q', '')
@@ -322,89 +2447,40 @@ def delete_entry(category, index):
 # Modify get_trailer function similarly
 @app.route('/trailer')
 def get_trailer():
-    settings = app_settings
     name = request.args.get('name')
     media_type = request.args.get('type')
     year = request.args.get('year')
     country = request.args.get('country')
 
-    if settings.api_provider == "custom" and settings.trailer_api_url:
-        # Custom trailer API implementation
-        # Example: response = requests.get(settings.trailer_api_url, params={...})
-        # return {'trailer_url': response.json().get('trailer_url')}
-        return {'trailer_url': None}
-    else:
-        # Original TMDB implementation
-        API_KEY = settings.api_key
-        search_type = media_type.lower().split()[0]
-        search_url = f'https://api.themoviedb.org/3/search/{search_type}'
-        video_url_template = 'https://api.themoviedb.org/3/{type}/{id}/videos'
-
-        search_params = {
-            'api_key': API_KEY,
-            'query': name,
-            'include_adult': False
+    try:
+        trailer = find_trailer(name, media_type, year, country)
+        if trailer:
+            return {'trailer_url': trailer['trailer_url']}
+    except Exception as e:
+        print(f"[ERROR] Fetching trailer failed: {e}")
+
+    return {'trailer_url': None}
+
+# Stored trailers for many entries at once, ?id=...&id=...
+@app.route('/trailers')
+def get_trailers():
+    trailers = {}
+    for entry_id in request.args.getlist('id'):
+        found = collection.get(entry_id)
+        if not found:
+            continue
+        entry = found[1]
+        if not entry.get('trailer_checked'):
+            trailer_prefetcher.enqueue(entry_id)
+        trailers[entry_id] = {
+            'trailer_url': entry.get('trailer_url'),
+            'pending': not entry.get('trailer_checked') or trailer_prefetcher.is_pending(entry_id),
         }
-        if year:
-            if search_type == 'movie':
-                search_params['year'] = year
-            elif search_type == 'tv':
-                search_params['first_air_date_year'] = year
-        if country:
-            search_params['region'] = country.upper()
+    return jsonify({"trailers": trailers})
 
-        try:
-            search_res = requests.get(search_url, params=search_params).json()
-            results = search_res.get('results', [])
-            if not results:
-                print(f"[INFO] No results found for: {name}")
-                # Try without region/year if initial search fails
-                new_params = {k: v for k, v in search_params.items() if k not in ['region', 'year', 'first_air_date_year']}
-                search_res = requests.get(search_url, params=new_params).json()
-                results = search_res.get('results', [])
-                if not results:
-                    return {'trailer_url': None}
-
-            # Improved exact matching
-            title_key = 'name' if search_type == 'tv' else 'title'
-            clean_name = re.sub(r'[^\w\s]', '', name.lower())
-
-            exact_match = None
-            for item in results:
-                item_title = re.sub(r'[^\w\s]', '', item.get(title_key, '').lower())
-                if item_title == clean_name:
-                    exact_match = item
-                    break
-
-            # Fallback to partial match if no exact match
-            item_id = None
-            if exact_match:
-                item_id = exact_match['id']
-            else:
-                for item in results:
-                    item_title = item.get(title_key, '').lower()
-                    if name.lower() in item_title:
-                        item_id = item['id']
-                        break
-
-            if not item_id:
-                item_id = results[0]['id'] if results else None
-
-            if not item_id:
-                return {'trailer_url': None}
-
-            video_url = video_url_template.format(type=search_type, id=item_id)
-            video_res = requests.get(video_url, params={'api_key': API_KEY}).json()
-            videos = video_res.get('results', [])
-
-            for vid in videos:
-                if vid['type'] == 'Trailer' and vid['site'] == 'YouTube':
-                    return {'trailer_url': f"https://www.youtube.com/embed/{vid['key']}"}
-
-        except Exception as e:
-            print(f"[ERROR] Fetching trailer failed: {e}")
-
-        return {'trailer_url': None}
+@app.route('/cache_stats')
+def cache_stats():
+    return jsonify(api_cache.get_stats())
 
 # Add this route
 @app.route('/settings', methods=['GET', 'POST'])
@@ -418,7 +2494,15 @@ def settings():
             app_settings.poster_api_url = request.form['poster_api_url']
             app_settings.trailer_api_url = request.form['trailer_api_url']
         app_settings.local_media_path = request.form['local_media_path']  # Add this line
+        app_settings.profile_requests = 'profile_requests' in request.form
         app_settings.save()
+        if app_settings.local_media_path and os.path.exists(app_settings.local_media_path):
+            # Index and watch the new media path in the background
+            threading.Thread(target=library_index.refresh, args=(app_settings.local_media_path,), daemon=True).start()
+            try:
+                library_watcher.watch(app_settings.local_media_path)
+            except Exception as e:
+                print(f"[WARN] Cannot watch {app_settings.local_media_path}: {e}")
         return redirect(url_for('index'))
     
     return render_template('settings.html', settings=app_settings)
@@ -430,64 +2514,75 @@ def local_media():
     media_type = request.args.get('type')
     base_path = app_settings.local_media_path
 
-    if not base_path or not os.path.exists(base_path):
+    if not media_path_ready():
         return jsonify({"error": "Local media path not set or does not exist"})
 
     results = []
-    normalized_name = re.sub(r'[^a-z0-9]', '', name.lower())
+    normalized_name = normalize_title(name or '')
 
     try:
-        base_path = os.path.normpath(base_path)
-        
-        if media_type == 'movie':
-            # Movie search remains unchanged
-            for root, _, files in os.walk(base_path):
-                for file in files:
-                    if file.lower().endswith(('.mp4', '.mkv', '.avi', '.mov')):
-                        file_path = os.path.join(root, file)
-                        file_name = os.path.splitext(file)[0]
-                        normalized_file = re.sub(r'[^a-z0-9]', '', file_name.lower())
-                        if normalized_name in normalized_file:
-                            results.append({
-                                "name": file,
-                                "path": file_path
-                            })
-                            
-        elif media_type == 'series':
-            # NEW: Search all video files recursively
-            for root, _, files in os.walk(base_path):
-                for file in files:
-                    if file.lower().endswith(('.mp4', '.mkv', '.avi', '.mov')):
-                        file_path = os.path.join(root, file)
-                        file_name = os.path.splitext(file)[0]
-                        normalized_file = re.sub(r'[^a-z0-9]', '', file_name.lower())
-                        
-                        # Check if series name appears in filename
-                        if normalized_name in normalized_file:
-                            # Extract episode number directly from filename
-                            ep_match = re.search(r'(\d{3,4}(?:\.\d+)?)', file)
-                            ep_num = ep_match.group(1) if ep_match else "Unknown"
-
-                            results.append({
-                                "name": file,
-                                "episode": ep_num,
-                                "path": file_path
-                            })
+        library = ensure_library_index()
     except Exception as e:
         print(f"Error scanning media: {e}")
         return jsonify({"error": "Error scanning media files"})
 
-    # Sort episodes by episode number if series
-    if media_type == 'series':
-        def extract_ep_num(item):
-            try:
-                return float(item.get("episode", "0"))
-            except Exception:
-                return 0
-        results.sort(key=extract_ep_num)
+    # Answers only change with the library or the collection
+    cached = client_etag(version_etag('local_media', base_path, sorted(request.args.items(multi=True))))
+    if cached:
+        return not_modified(cached)
+
+    # Cards pass their entry id, whose files are known from the match index
+    entry_id = request.args.get('id')
+    if entry_id:
+        match = match_index.get(entry_id)
+        if not match:
+            return jsonify({"results": []})
+        if match['kind'] == 'series':
+            return series_results(episode_index.get(match['name']), request.args.get('ep'))
+        return jsonify({"results": [{"name": os.path.basename(path), "path": path} for path in match['files']]})
+
+    if media_type == 'movie':
+        for row in library.search(normalized_name):
+            results.append({
+                "name": row['name'],
+                "path": row['path']
+            })
+    elif media_type == 'series':
+        return series_results(episode_index.get(name), request.args.get('ep'))
 
     return jsonify({"results": results})
 
+def series_results(record, ep):
+    # Episodes come sorted from the episode index, ep marks the one the
+    # entry is at
+    if not record:
+        return jsonify({"results": []})
+    current = episode_index.locate(record, ep)
+    results = [{
+        "name": episode['name'],
+        "episode": episode['label'],
+        "path": episode['path'],
+        "current": position == current,
+    } for position, episode in enumerate(record['episodes'])]
+    following = record['next'][current] if current is not None else None
+    return jsonify({"results": results,
+                    "next": record['episodes'][following] if following is not None else None})
+
+@app.route('/continue_watching')
+def continue_watching():
+    if not media_path_ready():
+        return jsonify({"results": []})
+    ensure_library_index()
+    return jsonify({"results": episode_index.continue_watching(collection.items('series'), match_index)})
+
+@app.route('/next_episode')
+def next_episode():
+    path = os.path.normpath(request.args.get('path', ''))
+    if not media_path_ready():
+        return jsonify({"next": None})
+    ensure_library_index()
+    return jsonify({"next": episode_index.next_episode(path)})
+
 # Add endpoint to serve local media
 @app.route('/play_local')
 def play_local():
@@ -513,8 +2608,881 @@ def play_local():
     if not full_path.startswith(base_path):
         return f"Forbidden: File not in media directory {base_path}", 403
 
+    # Browser-incompatible files go through ffmpeg as HLS when it's available
+    hls_src = None
+    plan = hls_transcoder.plan(full_path)
+    if plan != 'direct':
+        key = hls_transcoder.start(full_path, plan)
+        hls_src = stream_url(url_for('hls_file', key=key, filename=HLS_PLAYLIST))
+
     # Pass the filename as title
-    return render_template('video_player.html', title=os.path.basename(full_path), path=file_path)
+    next_file = episode_index.next_episode(file_path)
+    return render_template('video_player.html', title=os.path.basename(full_path), video_src=video_url(file_path),
+                           hls_src=hls_src, next_episode=next_file, sprite=local_sprite(full_path))
+
+# Byte-range streaming for /video_file. Servers that expose
+# wsgi.file_wrapper get the open file positioned at the range start:
+# gunicorn hands its fileno() to sendfile(), waitress streams it from its
+# I/O loop so the worker thread is free again. Otherwise the range is read
+# in fixed-size chunks, so each viewer holds a single bounded buffer.
+VIDEO_MIMETYPES = {
+    '.mp4': 'video/mp4',
+    '.mkv': 'video/x-matroska',
+    '.avi': 'video/x-msvideo',
+    '.mov': 'video/quicktime',
+}
+
+class StreamStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.requests = 0
+        self.partial_requests = 0
+        self.bytes_sent = 0
+        self.seconds = 0.0
+
+    def start(self, partial, limit=0):
+        # Returns None instead when limit streams are already running
+        with self.lock:
+            if limit and self.active >= limit:
+                return None
+            self.active += 1
+            self.requests += 1
+            if partial:
+                self.partial_requests += 1
+        return time.monotonic()
+
+    def finish(self, started, sent):
+        with self.lock:
+            self.active -= 1
+            self.bytes_sent += sent
+            self.seconds += time.monotonic() - started
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'active_streams': self.active,
+                'requests': self.requests,
+                'partial_requests': self.partial_requests,
+                'bytes_sent': self.bytes_sent,
+                'average_throughput_bps': self.bytes_sent / self.seconds if self.seconds else 0.0,
+            }
+
+stream_stats = StreamStats()
+held_stream_limit = 0  # Set by serve() when chunked streams share the page pool, 0 = unlimited
+
+class RangeFileIterator:
+    def __init__(self, path, start, length, chunk_size, started):
+        self.file = open(path, 'rb')
+        self.file.seek(start)
+        self.remaining = length
+        self.chunk_size = chunk_size
+        self.started = started
+        self.sent = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.remaining <= 0:
+            raise StopIteration
+        data = self.file.read(min(self.chunk_size, self.remaining))
+        if not data:
+            raise StopIteration
+        self.remaining -= len(data)
+        self.sent += len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+        stream_stats.finish(self.started, self.sent)
+
+# File handed to wsgi.file_wrapper. Reads stop at the end of the range, and
+# fileno() is the real file's, which sendfile() reads from the current
+# position for Content-Length bytes. Servers close the file when done
+# (waitress from its own output buffer), so closing it is the only point
+# where a stream is known to have ended.
+class StreamedFile:
+    def __init__(self, path, start, length, started):
+        self.file = open(path, 'rb')
+        self.file.seek(start)
+        self.start = start
+        self.length = length
+        self.started = started
+        self.closed = False
+
+    def read(self, size=-1):
+        remaining = max(self.start + self.length - self.file.tell(), 0)
+        return self.file.read(remaining if size is None or size < 0 else min(size, remaining))
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def seek(self, offset, whence=0):
+        return self.file.seek(offset, whence)
+
+    def tell(self):
+        return self.file.tell()
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        # sendfile() doesn't move the file position, so a file that was
+        # never read is counted as sent in full
+        position = self.file.tell()
+        sent = min(position - self.start, self.length) if position > self.start else self.length
+        self.file.close()
+        stream_stats.finish(self.started, sent)
+
+def stream_file(full_path):
+    stat = os.stat(full_path)
+    size = stat.st_size
+    etag = f"{stat.st_mtime_ns:x}-{size:x}"
+    mimetype = mimetypes.guess_type(full_path)[0] or VIDEO_MIMETYPES.get(
+        os.path.splitext(full_path)[1].lower(), 'application/octet-stream')
+
+    headers = {
+        'Accept-Ranges': 'bytes',
+        'ETag': f'"{etag}"',
+        'Last-Modified': http_date(stat.st_mtime),
+        'Cache-Control': 'private, max-age=0',
+    }
+
+    # Only honour Range when If-Range (if sent) still matches this file
+    byte_range = request.range
+    if_range = request.if_range
+    if if_range and (if_range.etag or if_range.date):
+        if if_range.etag:
+            range_valid = if_range.etag == etag
+        else:
+            range_valid = int(stat.st_mtime) <= int(if_range.date.timestamp())
+        if not range_valid:
+            byte_range = None
+    if byte_range is not None and len(byte_range.ranges) != 1:
+        # Multipart ranges aren't supported, the whole file is a valid answer
+        byte_range = None
+
+    if byte_range is None and request.if_none_match.contains(etag):
+        return Response(status=304, headers=headers)
+
+    start, stop, status = 0, size, 200
+    if byte_range is not None:
+        bounds = byte_range.range_for_length(size)
+        if bounds is None:
+            headers['Content-Range'] = f"bytes */{size}"
+            return Response(status=416, headers=headers)
+        start, stop = bounds
+        status = 206
+        headers['Content-Range'] = f"bytes {start}-{stop - 1}/{size}"
+    length = stop - start
+    headers['Content-Length'] = str(length)
+
+    file_wrapper = request.environ.get('wsgi.file_wrapper')
+    if app_settings.video_sendfile and file_wrapper:
+        started = stream_stats.start(status == 206)
+        body = file_wrapper(StreamedFile(full_path, start, length, started), int(app_settings.video_chunk_size))
+        return Response(body, status=status, headers=headers, mimetype=mimetype, direct_passthrough=True)
+
+    # Chunked streams hold their thread until the viewer is done
+    started = stream_stats.start(status == 206, held_stream_limit)
+    if started is None:
+        return Response("Too many streams", status=503, headers={'Retry-After': '5'})
+    body = RangeFileIterator(full_path, start, length, int(app_settings.video_chunk_size), started)
+    return Response(body, status=status, headers=headers, mimetype=mimetype, direct_passthrough=True)
+
+@app.route('/stream_stats')
+def get_stream_stats():
+    return jsonify(stream_stats.snapshot())
+
+# Request timing and the optional profiling hook. Only one request is
+# profiled at a time, cProfile can't run in several threads at once.
+PROFILE_FOLDER = "profiles"
+_profile_lock = threading.Lock()
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.monotonic()
+    if app_settings.profile_requests and _profile_lock.acquire(blocking=False):
+        g.profiler = cProfile.Profile()
+        g.profiler.enable()
+
+@app.after_request
+def _record_request_time(response):
+    started = g.get('request_started')
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.observe('myflixvault_request_seconds', time.monotonic() - started, route=route, method=request.method)
+        metrics.inc('myflixvault_requests_total', route=route, method=request.method, status=str(response.status_code))
+    return response
+
+@app.teardown_request
+def _stop_request_profiler(exc):
+    profiler = g.pop('profiler', None)
+    if profiler is None:
+        return
+    try:
+        profiler.disable()
+        elapsed = time.monotonic() - g.request_started
+        if elapsed >= float(app_settings.profile_min_seconds):
+            os.makedirs(PROFILE_FOLDER, exist_ok=True)
+            name = f"{time.strftime('%Y%m%d-%H%M%S')}-{request.endpoint or 'unmatched'}-{int(elapsed * 1000)}ms.prof"
+            profiler.dump_stats(os.path.join(PROFILE_FOLDER, name))
+    finally:
+        _profile_lock.release()
+
+def _collect_gauges():
+    for endpoint, counts in api_cache.get_stats()['endpoints'].items():
+        for result in ('hits', 'negative_hits', 'misses'):
+            yield 'myflixvault_api_cache_lookups', {'endpoint': endpoint, 'result': result}, counts[result]
+        yield 'myflixvault_api_cache_evictions', {'endpoint': endpoint}, counts['evictions']
+    yield 'myflixvault_api_cache_entries', {}, api_cache.count
+    streams = stream_stats.snapshot()
+    yield 'myflixvault_active_streams', {}, streams['active_streams']
+    yield 'myflixvault_stream_bytes_sent', {}, streams['bytes_sent']
+    with thumbnail_worker.lock:
+        yield 'myflixvault_thumbnail_jobs', {}, len(thumbnail_worker.jobs)
+    yield 'myflixvault_library_generation', {}, library_index.generation
+
+metrics.describe('myflixvault_api_cache_lookups', 'counter', 'Provider response cache lookups, per endpoint and result')
+metrics.describe('myflixvault_api_cache_evictions', 'counter', 'Provider responses evicted to stay under the size limit')
+metrics.describe('myflixvault_api_cache_entries', 'gauge', 'Provider responses cached on disk')
+metrics.describe('myflixvault_active_streams', 'gauge', 'Video streams in progress')
+metrics.describe('myflixvault_stream_bytes_sent', 'counter', 'Video bytes sent')
+metrics.describe('myflixvault_thumbnail_jobs', 'gauge', 'Poster thumbnails queued or being generated')
+metrics.describe('myflixvault_library_generation', 'counter', 'Local library changes applied since startup')
+metrics.register_collector(_collect_gauges)
+
+@app.route('/metrics')
+def get_metrics():
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+# Strong ETags and compression for pages and JSON. Routes whose answer only
+# depends on the content version check If-None-Match before doing any work,
+# other responses get an ETag hashed from their body. Compressed bodies get
+# the encoding appended to their ETag, a client holding any encoding of the
+# current content gets a 304.
+COMPRESS_MIMETYPES = {'text/html', 'application/json', 'text/plain'}
+COMPRESS_MIN_BYTES = 1024  # Smaller bodies aren't worth compressing
+CONTENT_ENCODINGS = ('br', 'gzip') if brotli else ('gzip',)
+BROTLI_QUALITY = 5  # Brotli's 11 is far too slow for per-request compression
+GZIP_LEVEL = 6
+
+def version_etag(*key):
+    g.etag = hashlib.md5(repr((content_version(),) + key).encode()).hexdigest()
+    return g.etag
+
+def client_etag(etag):
+    # The form of etag the client already holds, if any
+    for suffix in ('', '-gzip', '-br'):
+        if request.if_none_match.contains(etag + suffix):
+            return etag + suffix
+    return None
+
+def not_modified(etag):
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.vary.add('Accept-Encoding')
+    return response
+
+def compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+@app.after_request
+def _finish_response(response):
+    if (request.method != 'GET' or response.status_code != 200 or response.direct_passthrough
+            or response.is_streamed or response.mimetype not in COMPRESS_MIMETYPES):
+        return response
+    body = response.get_data()
+    etag = g.get('etag') or hashlib.md5(body).hexdigest()
+    cached = client_etag(etag)
+    if cached:
+        return not_modified(cached)
+
+    # Revalidated on every use, which costs a 304 while nothing changed
+    response.headers.setdefault('Cache-Control', 'no-cache')
+    response.vary.add('Accept-Encoding')
+    encoding = None
+    if len(body) >= COMPRESS_MIN_BYTES and 'Content-Encoding' not in response.headers:
+        encoding = request.accept_encodings.best_match(CONTENT_ENCODINGS)
+    if encoding:
+        response.set_data(compress(body, encoding))
+        response.headers['Content-Encoding'] = encoding
+        etag += f"-{encoding}"
+    response.set_etag(etag)
+    return response
+
+active_stream_port = 0  # Set by serve() once the video server is listening
+
+def video_url(path):
+    return stream_url(url_for('serve_video_file', path=path))
+
+def stream_url(url):
+    # Points at the streaming server when video has a port of its own
+    if not active_stream_port:
+        return url
+    host = urllib.parse.urlsplit(f"//{request.host}").hostname
+    if ':' in host:
+        host = f"[{host}]"
+    return f"{request.scheme}://{host}:{active_stream_port}{url}"
+
+# On-the-fly HLS for files browsers can't play directly. ffmpeg remuxes
+# (H.264/AAC in an MKV, say), re-encodes only the audio (H.264 with AC-3 or
+# DTS) or transcodes into fragmented MP4 segments,
+# written under HLS_FOLDER/<key>/ where the key covers path, size and
+# mtime. The playlist is usable while ffmpeg is still writing, so playback
+# starts after the first segment; finished outputs stay cached for repeat
+# views and the least recently watched ones are evicted past hls_cache_max_bytes.
+HLS_FOLDER = "hls"
+HLS_PLAYLIST = "index.m3u8"
+HLS_DONE_MARKER = ".done"
+HLS_WAIT = 20  # Seconds a playlist request waits for ffmpeg to produce it
+HLS_MIMETYPES = {
+    '.m3u8': 'application/vnd.apple.mpegurl',
+    '.m4s': 'video/iso.segment',
+    '.mp4': 'video/mp4',
+}
+BROWSER_VIDEO_CODECS = ('h264',)
+BROWSER_AUDIO_CODECS = ('aac', 'mp3')
+BROWSER_CONTAINERS = ('.mp4', '.mov')
+
+FFMPEG_RECHECK = 300  # Seconds before ffmpeg/ffprobe are looked up on the PATH again
+_ffmpeg_checks = {}  # (ffmpeg path, ffprobe path) -> (found, time checked)
+
+class HlsTranscoder:
+    def __init__(self, folder, workers):
+        self.folder = folder
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hls")
+        self.jobs = {}  # key -> future
+        self.processes = {}  # key -> running ffmpeg
+        os.makedirs(folder, exist_ok=True)
+
+    def cleanup(self):
+        # Outputs of jobs that were cut short by a restart are useless
+        for key in os.listdir(self.folder):
+            if not os.path.exists(os.path.join(self.folder, key, HLS_DONE_MARKER)):
+                shutil.rmtree(os.path.join(self.folder, key), ignore_errors=True)
+
+    @staticmethod
+    def available():
+        # shutil.which walks PATH, so the answer is kept for a while. Cards
+        # ask for every title on every page.
+        paths = (app_settings.ffmpeg_path, app_settings.ffprobe_path)
+        found, checked = _ffmpeg_checks.get(paths, (False, 0))
+        if time.time() - checked > FFMPEG_RECHECK:
+            found = bool(shutil.which(paths[0]) and shutil.which(paths[1]))
+            _ffmpeg_checks[paths] = (found, time.time())
+        return found
+
+    @staticmethod
+    def make_key(path):
+        stat = os.stat(path)
+        return hashlib.sha1(f"{path}|{stat.st_size}|{stat.st_mtime_ns}".encode('utf-8')).hexdigest()[:20]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def probe(path, size, mtime):
+        # (video codec, audio codec), size and mtime are only part of the cache key
+        result = subprocess.run(
+            [app_settings.ffprobe_path, '-v', 'error', '-show_entries', 'stream=codec_type,codec_name',
+             '-of', 'json', path],
+            capture_output=True, text=True, timeout=30)
+        streams = json.loads(result.stdout or '{}').get('streams', [])
+        video = next((s.get('codec_name') for s in streams if s.get('codec_type') == 'video'), None)
+        audio = next((s.get('codec_name') for s in streams if s.get('codec_type') == 'audio'), None)
+        return video, audio
+
+    def plan(self, path):
+        # 'direct', 'remux', 'audio' (copy the video, re-encode the audio) or 'transcode'
+        mode = app_settings.transcode_mode
+        if mode == 'off' or not self.available():
+            return 'direct'
+        stat = os.stat(path)
+        try:
+            video, audio = self.probe(path, stat.st_size, stat.st_mtime_ns)
+        except (OSError, ValueError, subprocess.SubprocessError) as e:
+            print(f"[WARN] Probing {path} failed: {e}")
+            return 'direct'
+        video_ok = video in BROWSER_VIDEO_CODECS
+        audio_ok = audio is None or audio in BROWSER_AUDIO_CODECS
+        if video_ok and audio_ok and mode != 'always' and os.path.splitext(path)[1].lower() in BROWSER_CONTAINERS:
+            return 'direct'
+        if video_ok:
+            return 'remux' if audio_ok else 'audio'
+        return 'transcode'
+
+    def command(self, path, out_dir, plan):
+        if plan == 'remux':
+            codecs = ['-c:v', 'copy', '-c:a', 'copy']
+        elif plan == 'audio':
+            codecs = ['-c:v', 'copy', '-c:a', 'aac', '-b:a', '160k', '-ac', '2']
+        else:
+            codecs = ['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23', '-pix_fmt', 'yuv420p',
+                      '-c:a', 'aac', '-b:a', '160k', '-ac', '2']
+        return [
+            app_settings.ffmpeg_path, '-nostdin', '-loglevel', 'error', '-i', path,
+            '-map', '0:v:0', '-map', '0:a:0?', *codecs,
+            '-f', 'hls', '-hls_time', str(app_settings.hls_segment_seconds),
+            '-hls_playlist_type', 'event', '-hls_segment_type', 'fmp4',
+            '-hls_fmp4_init_filename', 'init.mp4',
+            '-hls_segment_filename', os.path.join(out_dir, 'seg%05d.m4s'),
+            os.path.join(out_dir, HLS_PLAYLIST),
+        ]
+
+    def start(self, path, plan):
+        # Returns the cache key, queueing ffmpeg unless the output exists
+        key = self.make_key(path)
+        out_dir = os.path.join(self.folder, key)
+        with self.lock:
+            if key in self.jobs or os.path.exists(os.path.join(out_dir, HLS_DONE_MARKER)):
+                return key
+            os.makedirs(out_dir, exist_ok=True)
+            self.jobs[key] = self.executor.submit(self._run, key, path, self.command(path, out_dir, plan))
+        return key
+
+    def _run(self, key, path, cmd):
+        out_dir = os.path.join(self.folder, key)
+        started = time.monotonic()
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            with self.lock:
+                self.processes[key] = process
+            _, stderr = process.communicate()
+            if process.returncode == 0:
+                open(os.path.join(out_dir, HLS_DONE_MARKER), 'w').close()
+                metrics.observe('myflixvault_hls_job_seconds', time.monotonic() - started, result='ok')
+            else:
+                print(f"[ERROR] ffmpeg failed for {path}: {stderr.decode('utf-8', 'replace')[-500:]}")
+                metrics.observe('myflixvault_hls_job_seconds', time.monotonic() - started, result='failed')
+                shutil.rmtree(out_dir, ignore_errors=True)
+        except OSError as e:
+            print(f"[ERROR] Starting ffmpeg failed: {e}")
+            shutil.rmtree(out_dir, ignore_errors=True)
+        finally:
+            with self.lock:
+                self.jobs.pop(key, None)
+                self.processes.pop(key, None)
+        self.evict()
+
+    def touch(self, key):
+        # Directory mtime doubles as the last watched time for eviction
+        try:
+            os.utime(os.path.join(self.folder, key))
+        except OSError:
+            pass
+
+    def evict(self):
+        budget = int(app_settings.hls_cache_max_bytes)
+        with self.lock:
+            active = set(self.jobs)
+        entries, total = [], 0
+        for key in os.listdir(self.folder):
+            out_dir = os.path.join(self.folder, key)
+            try:
+                size = sum(entry.stat().st_size for entry in os.scandir(out_dir))
+                entries.append((os.stat(out_dir).st_mtime, key, size))
+            except OSError:
+                continue
+            total += size
+        for _, key, size in sorted(entries):
+            if total <= budget:
+                break
+            if key in active:
+                continue
+            shutil.rmtree(os.path.join(self.folder, key), ignore_errors=True)
+            total -= size
+            print(f"[INFO] Evicted HLS cache {key} ({size // (1024 * 1024)} MB)")
+
+    def wait_for(self, key, filename, timeout):
+        # Segments show up while ffmpeg runs, poll until the file exists
+        path = os.path.join(self.folder, key, filename)
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(path):
+            with self.lock:
+                running = key in self.jobs
+            if not running or time.monotonic() > deadline:
+                return os.path.exists(path)
+            time.sleep(0.25)
+        return True
+
+    def stop(self):
+        with self.lock:
+            processes = list(self.processes.values())
+        for process in processes:
+            process.terminate()
+
+hls_transcoder = HlsTranscoder(HLS_FOLDER, int(app_settings.transcode_jobs))
+atexit.register(hls_transcoder.stop)
+metrics.describe('myflixvault_hls_job_seconds', 'histogram', 'ffmpeg remux/transcode job duration')
+
+@app.route('/hls/<key>/<filename>')
+def hls_file(key, filename):
+    if not re.fullmatch(r'[0-9a-f]{20}', key) or os.path.splitext(filename)[1] not in HLS_MIMETYPES:
+        return "Not found", 404
+    if not hls_transcoder.wait_for(key, filename, HLS_WAIT):
+        return "Not found", 404
+    if filename == HLS_PLAYLIST:
+        hls_transcoder.touch(key)
+    response = send_from_directory(os.path.join(HLS_FOLDER, key), filename,
+                                   mimetype=HLS_MIMETYPES[os.path.splitext(filename)[1]])
+    # The playlist grows while ffmpeg runs, segments never change
+    if filename == HLS_PLAYLIST:
+        response.headers['Cache-Control'] = 'no-cache'
+    else:
+        response.headers['Cache-Control'] = 'public, max-age=86400'
+    # hls.js fetches these with XHR, possibly from the main port
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    return response
+
+# Preview images cut from the local files themselves: a representative
+# frame, used when no poster is found, and a sprite sheet of evenly spaced
+# frames for seek previews in the player. Stored in the thumbnail folder
+# under a key of path, size and mtime, so a replaced file gets new previews.
+# Everything goes through one queue of pending files, fed by the library
+# at startup, library changes and page renders, and drained by the backfill
+# thread with at most preview_workers ffmpeg processes at a time. Previews
+# a page or the player is waiting for move to the front. Past
+# preview_cache_max_bytes only those are made, evicting the least recently
+# served previews to make room; serving a preview touches its file.
+PREVIEW_FILE_RE = re.compile(r'^(frame|sprite)-([0-9a-f]{20})\.(jpg|json)$')
+PREVIEW_FRAME_WIDTH = 320
+PREVIEW_FRAME_AT = 0.1  # Share of the runtime the poster frame is taken from
+SPRITE_FRAMES = 60
+SPRITE_COLUMNS = 10
+SPRITE_TILE_WIDTH = 160
+
+def preview_key(path, size=None, mtime=None):
+    if size is None or mtime is None:
+        stat = os.stat(path)
+        size, mtime = stat.st_size, stat.st_mtime
+    return hashlib.sha1(f"{path}|{size}|{mtime}".encode('utf-8')).hexdigest()[:20]
+
+class VideoPreviewWorker:
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preview")
+        self.lock = threading.Lock()
+        self.jobs = {}  # key -> future
+        self.failed = {}  # key -> time of the last failure
+        self.pending = OrderedDict()  # path -> (size, mtime, urgent), waiting for the backfill
+        self.paths = {}  # key -> path, to find a pending file by the preview asked for
+        self.keys = {}  # path -> key of the previews last made for it
+        self.stale = set()  # paths removed from the library, their previews go
+        self.wakeup = threading.Event()
+        self.bytes = 0  # Size of all preview files, measured when the backfill starts
+
+    @staticmethod
+    def enabled():
+        return bool(app_settings.video_previews) and HlsTranscoder.available()
+
+    @staticmethod
+    def is_complete(key):
+        # The sprite manifest is written last
+        return os.path.exists(os.path.join(TEMP_FOLDER, f"sprite-{key}.json"))
+
+    def request(self, path, size=None, mtime=None, urgent=False):
+        # Queues previews for the backfill and returns their key, or None
+        # when previews can't be made
+        if not self.enabled():
+            return None
+        try:
+            key = preview_key(path, size, mtime)
+        except OSError:
+            return None
+        with self.lock:
+            if key in self.jobs or self.is_complete(key):
+                return key
+            if time.time() - self.failed.get(key, 0) < THUMBNAIL_RETRY_AFTER:
+                return key
+            self.paths[key] = path
+            urgent = urgent or self.pending.get(path, (None, None, False))[2]
+            self.pending[path] = (size, mtime, urgent)
+            if urgent:
+                self.pending.move_to_end(path, last=False)
+        self.wakeup.set()
+        return key
+
+    def prioritize(self, key):
+        with self.lock:
+            path = self.paths.get(key)
+            if path in self.pending:
+                self.pending[path] = self.pending[path][:2] + (True,)
+                self.pending.move_to_end(path, last=False)
+
+    def _submit(self, path, size, mtime):
+        try:
+            key = preview_key(path, size, mtime)
+        except OSError:
+            return
+        with self.lock:
+            if key in self.jobs or self.is_complete(key):
+                return
+            if time.time() - self.failed.get(key, 0) < THUMBNAIL_RETRY_AFTER:
+                return
+            job = self.jobs[key] = self.executor.submit(self._generate, key, path)
+        job.add_done_callback(lambda _: self._finish(key))
+
+    def job(self, key):
+        with self.lock:
+            return self.jobs.get(key)
+
+    def _finish(self, key):
+        with self.lock:
+            self.jobs.pop(key, None)
+
+    @staticmethod
+    def _duration(path):
+        result = subprocess.run(
+            [app_settings.ffprobe_path, '-v', 'error', '-show_entries', 'format=duration', '-of', 'json', path],
+            capture_output=True, text=True, timeout=30)
+        return float(json.loads(result.stdout or '{}').get('format', {}).get('duration') or 0)
+
+    @staticmethod
+    def _grab(path, seconds, width):
+        # One frame as a PIL image, seeking on the input so long files stay cheap
+        result = subprocess.run(
+            [app_settings.ffmpeg_path, '-nostdin', '-loglevel', 'error', '-ss', f"{seconds:.2f}", '-i', path,
+             '-frames:v', '1', '-vf', f"scale={width}:-2", '-f', 'image2pipe', '-vcodec', 'mjpeg', '-'],
+            capture_output=True, timeout=60)
+        if result.returncode != 0 or not result.stdout:
+            raise RuntimeError(result.stderr.decode('utf-8', 'replace')[-300:] or "no frame")
+        return Image.open(BytesIO(result.stdout)).convert('RGB')
+
+    @staticmethod
+    def _sprite(path, interval):
+        # The whole sheet from a single ffmpeg run: only keyframes are
+        # decoded, fps picks one every interval and tile lays them out
+        rows = -(-SPRITE_FRAMES // SPRITE_COLUMNS)
+        result = subprocess.run(
+            [app_settings.ffmpeg_path, '-nostdin', '-loglevel', 'error', '-skip_frame', 'nokey',
+             '-ss', f"{interval:.2f}", '-i', path, '-an', '-sn',
+             '-vf', f"fps=1/{interval:.3f},scale={SPRITE_TILE_WIDTH}:-2,tile={SPRITE_COLUMNS}x{rows}",
+             '-frames:v', '1', '-f', 'image2pipe', '-vcodec', 'mjpeg', '-'],
+            capture_output=True, timeout=600)
+        if result.returncode != 0 or not result.stdout:
+            raise RuntimeError(result.stderr.decode('utf-8', 'replace')[-300:] or "no sprite")
+        return Image.open(BytesIO(result.stdout)).convert('RGB')
+
+    def _generate(self, key, path):
+        started = time.monotonic()
+        try:
+            duration = self._duration(path)
+            if duration <= 0:
+                raise RuntimeError("unknown duration")
+            frame = self._grab(path, duration * PREVIEW_FRAME_AT, PREVIEW_FRAME_WIDTH)
+            ThumbnailWorker._save(frame, os.path.join(TEMP_FOLDER, f"frame-{key}.jpg"), "JPEG")
+
+            interval = duration / (SPRITE_FRAMES + 1)
+            sheet = self._sprite(path, interval)
+            rows = -(-SPRITE_FRAMES // SPRITE_COLUMNS)
+            ThumbnailWorker._save(sheet, os.path.join(TEMP_FOLDER, f"sprite-{key}.jpg"), "JPEG")
+
+            manifest = os.path.join(TEMP_FOLDER, f"sprite-{key}.json")
+            with open(manifest + ".part", 'w') as f:
+                json.dump({'interval': interval, 'count': SPRITE_FRAMES, 'columns': SPRITE_COLUMNS,
+                           'width': sheet.width // SPRITE_COLUMNS, 'height': sheet.height // rows}, f)
+            os.replace(manifest + ".part", manifest)
+            size = sum(os.path.getsize(os.path.join(TEMP_FOLDER, name)) for name in self._filenames(key))
+            with self.lock:
+                self.bytes += size
+            metrics.observe('myflixvault_preview_seconds', time.monotonic() - started, result='ok')
+        except Exception as e:
+            print(f"[ERROR] Extracting previews from {path} failed: {e}")
+            metrics.observe('myflixvault_preview_seconds', time.monotonic() - started, result='failed')
+            with self.lock:
+                self.failed[key] = time.time()
+
+    @staticmethod
+    def _filenames(key):
+        return (f"frame-{key}.jpg", f"sprite-{key}.jpg", f"sprite-{key}.json")
+
+    def _remove(self, key):
+        for filename in self._filenames(key):
+            path = os.path.join(TEMP_FOLDER, filename)
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                continue
+            with self.lock:
+                self.bytes -= size
+
+    def _measure(self):
+        # Returns {key: time last served} of the previews on disk
+        served, total = {}, 0
+        for entry in os.scandir(TEMP_FOLDER):
+            match = PREVIEW_FILE_RE.match(entry.name)
+            if not match:
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            total += stat.st_size
+            served[match.group(2)] = max(served.get(match.group(2), 0), stat.st_mtime)
+        with self.lock:
+            self.bytes = total
+        return served
+
+    def _evict(self):
+        # Makes room for one more file's previews, least recently served first
+        budget = int(app_settings.preview_cache_max_bytes)
+        with self.lock:
+            if self.bytes < budget:
+                return
+            active = set(self.jobs)
+        freed = self.bytes
+        for _, key in sorted((served, key) for key, served in self._measure().items()):
+            if self.bytes < budget:
+                break
+            if key not in active:
+                self._remove(key)
+        print(f"[INFO] Evicted {(freed - self.bytes) // 1024} KB of video previews to stay under the cache budget")
+
+    @staticmethod
+    def prune(rows):
+        # Keys change with size and mtime, so previews of deleted or replaced
+        # files are never looked up again. Keep only those of indexed files.
+        # Runs once at startup, library changes after that are pruned per file.
+        keys = {preview_key(row['path'], row['size'], row['mtime']) for row in rows}
+        removed = 0
+        for filename in os.listdir(TEMP_FOLDER):
+            match = PREVIEW_FILE_RE.match(filename)
+            if match and match.group(2) not in keys:
+                try:
+                    os.remove(os.path.join(TEMP_FOLDER, filename))
+                    removed += 1
+                except OSError:
+                    pass
+        if removed:
+            print(f"[INFO] Removed {removed} preview files of deleted or changed videos")
+
+    def on_library_change(self, generation, added, removed):
+        # Called with the library lock held, the backfill thread does the work
+        with self.lock:
+            for path in removed:
+                self.pending.pop(path, None)
+                self.stale.add(path)
+            for path in added:
+                self.stale.discard(path)
+                self.pending[path] = (None, None, False)
+        self.wakeup.set()
+
+    def add(self, rows):
+        with self.lock:
+            for row in rows:
+                self.pending[row['path']] = (row['size'], row['mtime'], False)
+        self.wakeup.set()
+
+    def backfill(self):
+        # Works through the pending files for good, keeping the executor's
+        # queue short so files asked for meanwhile don't wait behind the
+        # whole library
+        self._measure()
+        while True:
+            self.wakeup.wait(FFMPEG_RECHECK)
+            with self.lock:
+                stale, self.stale = self.stale, set()
+            for path in stale:
+                self._forget(path)
+            while self.enabled():
+                with self.lock:
+                    if not self.pending:
+                        self.wakeup.clear()
+                        break
+                    item = None
+                    if len(self.jobs) < self.workers * 2:
+                        item = self.pending.popitem(last=False)
+                if item is None:
+                    time.sleep(0.5)
+                    continue
+                path, (size, mtime, urgent) = item
+                try:
+                    key = preview_key(path, size, mtime)
+                except OSError:
+                    continue
+                if self.keys.get(path, key) != key:
+                    self._forget(path)  # The file was replaced
+                self.keys[path] = key
+                if self.is_complete(key):
+                    continue
+                if urgent:
+                    self._evict()
+                elif self.bytes >= int(app_settings.preview_cache_max_bytes):
+                    continue  # Over budget (by up to the jobs in flight), only wanted previews are made
+                self._submit(path, size, mtime)
+
+    def _forget(self, path):
+        key = self.keys.pop(path, None)
+        if key:
+            with self.lock:
+                self.paths.pop(key, None)
+            self._remove(key)
+
+video_previews = VideoPreviewWorker(int(app_settings.preview_workers))
+library_index.listeners.append(video_previews.on_library_change)
+metrics.describe('myflixvault_preview_seconds', 'histogram', 'Frame and sprite extraction time per video file')
+
+def preview_backfiller():
+    time.sleep(30)  # Let the first library scan and page loads go first
+    try:
+        if media_path_ready():
+            rows = ensure_library_index().files()
+            video_previews.prune(rows)
+            video_previews.add(rows)
+        video_previews.backfill()
+    except Exception as e:
+        print(f"[ERROR] Preview backfill failed: {e}")
+
+def local_frame_url(path, size=None, mtime=None):
+    key = video_previews.request(path, size, mtime)
+    return url_for('local_preview', filename=f"frame-{key}.jpg") if key else None
+
+def local_sprite(path):
+    # Sprite sheet URL and layout for the player, None until extracted
+    try:
+        key = preview_key(path)
+    except OSError:
+        return None
+    manifest = os.path.join(TEMP_FOLDER, f"sprite-{key}.json")
+    if not os.path.exists(manifest):
+        video_previews.request(path, urgent=True)
+        return None
+    with open(manifest) as f:
+        sprite = json.load(f)
+    sprite['url'] = url_for('local_preview', filename=f"sprite-{key}.jpg")
+    return sprite
+
+@app.route('/local_previews/<filename>')
+def local_preview(filename):
+    match = PREVIEW_FILE_RE.match(filename)
+    if not match:
+        return "Not found", 404
+    if not os.path.exists(os.path.join(TEMP_FOLDER, filename)):
+        video_previews.prioritize(match.group(2))
+        job = video_previews.job(match.group(2))
+        if job:
+            wait([job], timeout=THUMBNAIL_REQUEST_WAIT)
+        if not os.path.exists(os.path.join(TEMP_FOLDER, filename)):
+            response = send_from_directory(app.static_folder, 'poster-placeholder.svg')
+            response.headers['Cache-Control'] = 'no-store'
+            return response
+    # The file's mtime is its last served time for the preview budget
+    try:
+        os.utime(os.path.join(TEMP_FOLDER, filename))
+    except OSError:
+        pass
+    # The key changes with the file, so the image never does
+    response = send_from_directory(TEMP_FOLDER, filename, max_age=THUMBNAIL_MAX_AGE)
+    response.headers['Cache-Control'] = f'public, max-age={THUMBNAIL_MAX_AGE}, immutable'
+    return response
 
 # Serve the video file itself (for <video src="...">)
 @app.route('/video_file')
@@ -529,54 +3497,431 @@ def serve_video_file():
         return "Forbidden", 403
     if not os.path.exists(full_path):
         return "File not found", 404
-    return send_file(full_path)
+    return stream_file(full_path)
 
 @app.route('/local_videos')
 def local_videos():
-    base_path = app_settings.local_media_path
-    if not base_path or not os.path.exists(base_path):
-        return render_template('local_videos.html', error="Local media path not set or does not exist")
+    if not media_path_ready():
+        return render_template('local_videos.html', error="Local media path not set or does not exist",
+                               events_url=stream_url(url_for('local_video_events')))
+
+    media_items = {'movies': [], 'series': {}}
+    movies_by_name = {}
+
+    for row in ensure_library_index().files():
+        file_path = row['path']
+        file_info = row['info']
+
+        if not episode_index.is_episode(file_path):
+            existing = movies_by_name.get(file_info['name'])
+            if existing:
+                existing['files'].append(file_path)
+            else:
+                movie = {
+                    'name': file_info['name'],
+                    'year': file_info.get('year'),
+                    'files': [file_path],
+                    'frame_url': local_frame_url(file_path, row['size'], row['mtime']),
+                }
+                movies_by_name[file_info['name']] = movie
+                media_items['movies'].append(movie)
+
+    for record in episode_index.all_series():
+        media_items['series'][record['name']] = [{
+            'file_path': episode['path'],
+            'season': episode['season'],
+            'episode': episode['episode'],
+            'episode_str': episode['label'],
+        } for episode in record['episodes']]
+
+    # Resolve all posters concurrently, whatever misses the deadline is
+    # filled in later by the page through /local_videos/posters
+    titles = [(movie['name'], 'movie', movie['year']) for movie in media_items['movies']]
+    titles += [(name, 'tv', None) for name in media_items['series']]
+    posters = poster_resolver.resolve_many(titles, float(app_settings.metadata_page_deadline))
+
+    for movie in media_items['movies']:
+        movie['poster_key'] = poster_resolver.make_key(movie['name'], 'movie', movie['year'])
+        movie['poster_url'] = posters[movie['poster_key']]['poster_url']
+        movie['poster_pending'] = posters[movie['poster_key']]['pending']
 
-    media_items = {'movies': [], 'series': defaultdict(list)}
-    
-    for root, _, files in os.walk(base_path):
-        for file in files:
-            if file.lower().endswith(('.mp4', '.mkv', '.avi', '.mov')):
-                file_path = os.path.join(root, file)
-                file_info = extract_media_info(file)
-                
-                if file_info['type'] == 'movie':
-                    existing = next((m for m in media_items['movies'] if m['name'] == file_info['name']), None)
-                    if existing:
-                        existing['files'].append(file_path)
-                    else:
-                        media_items['movies'].append({
-                            'name': file_info['name'],
-                            'year': file_info.get('year'),
-                            'files': [file_path],
-                            'poster_url': get_movie_poster(file_info['name'], 'movie', file_info.get('year'))
-                        })
-                else:
-                    media_items['series'][file_info['name']].append({
-                        'file_path': file_path,
-                        'season': file_info.get('season'),
-                        'episode': file_info.get('episode'),
-                        'episode_str': file_info.get('episode_str')
-                    })
     # Prepare series for template
     series_list = []
     for name, episodes in media_items['series'].items():
-        poster_url = get_movie_poster(name, 'tv')
+        poster_key = poster_resolver.make_key(name, 'tv')
         series_list.append({
             'name': name,
-            'poster_url': poster_url,
+            'frame_url': local_frame_url(episodes[0]['file_path']) if episodes else None,
+            'poster_url': posters[poster_key]['poster_url'],
+            'poster_key': poster_key,
+            'poster_pending': posters[poster_key]['pending'],
             'episodes': episodes
         })
     
-    return render_template('local_videos.html', 
+    # partial=1 only renders the card lists, used to refresh an open page
+    template = '_local_cards.html' if request.args.get('partial') else 'local_videos.html'
+    return render_template(template, 
                            movies=media_items['movies'], 
-                           series=series_list)
+                           series=series_list,
+                           events_url=stream_url(url_for('local_video_events')))
+
+# Server-sent events telling open /local_videos pages that the library changed.
+# Streams end after event_stream_lifetime so their threads come back, the
+# browser reconnects on its own and sends the last generation it saw
+# (Last-Event-ID), which is answered with an event if it changed meanwhile.
+EVENT_RETRY_MS = 5000
+EVENT_FULL_RETRY_MS = 30000  # Retry delay for browsers turned away at the subscriber cap
+
+@app.route('/local_videos/events')
+def local_video_events():
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no',
+               'Access-Control-Allow-Origin': '*'}  # Served from stream_port when set
+    subscriber = library_events.subscribe()
+    if subscriber is None:
+        return Response(f"retry: {EVENT_FULL_RETRY_MS}\n\n", mimetype='text/event-stream', headers=headers)
+    generation = library_index.generation
+    last_seen = request.headers.get('Last-Event-ID')
+
+    def stream():
+        deadline = time.monotonic() + app_settings.event_stream_lifetime
+        try:
+            yield f"retry: {EVENT_RETRY_MS}\nid: {generation}\n\n"
+            if last_seen and last_seen != str(generation):
+                yield f"event: library\ndata: {json.dumps({'generation': generation})}\n\n"
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = subscriber.get(timeout=min(15, remaining))
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                if event is None:
+                    break  # Shutting down
+                yield f"id: {event['generation']}\nevent: library\ndata: {json.dumps(event)}\n\n"
+        finally:
+            library_events.unsubscribe(subscriber)
+
+    return Response(stream(), mimetype='text/event-stream', headers=headers)
+
+@app.route('/local_videos/posters')
+def local_video_posters():
+    keys = request.args.getlist('key')
+    posters = {}
+    for key, status in poster_resolver.lookup(keys).items():
+        poster_url = status['poster_url']
+        if poster_url:
+            poster_url = get_cached_poster(poster_url)
+        posters[key] = {'pending': status['pending'], 'poster_url': poster_url}
+    return jsonify({"posters": posters})
+
+# Production serving. Pages, API calls and posters are served by one thread
+# pool; with stream_port set, the long-lived requests (video, HLS and the
+# library event streams) get a second server and pool of its own so they
+# can't starve page loads. Without it they share the page pool, and only
+# what's left after MIN_PAGE_THREADS goes to them: event streams get a
+# quarter of that, chunked video (video_sendfile off) the rest. Video handed
+# to waitress's file wrapper is sent from its I/O loop and holds no thread.
+# Everything runs in one
+# process: the collection, caches and indexes are in-process state, so
+# concurrency comes from threads (which the I/O-bound handlers release the
+# GIL in) rather than extra worker processes.
+STREAM_PATHS = ('/video_file', '/hls/', '/local_videos/events')
+EVENT_POOL_SHARE = 4  # At most 1/4 of the serving pool's threads hold event streams
+MIN_PAGE_THREADS = 4  # Threads of the page pool long-lived requests never take
+SERVER_ENV_PREFIX = "MYFLIXVAULT_"
+SERVER_OPTIONS = ('server_host', 'server_port', 'server_threads', 'stream_port',
+                  'stream_threads', 'server_shutdown_timeout')
+
+def server_config(overrides=None):
+    # settings.json, then MYFLIXVAULT_<OPTION> environment variables, then command line
+    config = {}
+    for option in SERVER_OPTIONS:
+        default = getattr(app_settings, option)
+        value = os.environ.get(SERVER_ENV_PREFIX + option.upper(), default)
+        if overrides and overrides.get(option) is not None:
+            value = overrides[option]
+        config[option] = value if isinstance(default, str) else type(default)(value)
+    return config
+
+def streaming_app(environ, start_response):
+    if environ.get('PATH_INFO', '').startswith(STREAM_PATHS):
+        return app(environ, start_response)
+    return NotFound()(environ, start_response)
+
+class WSGIServer:
+    def __init__(self, name, wsgi_app, host, port, threads):
+        self.name = name
+        if create_server:
+            self.server = create_server(wsgi_app, host=host, port=port, threads=threads, ident="MyFlixVault")
+        else:
+            self.server = make_server(host, port, wsgi_app, threaded=True)
+        self.thread = threading.Thread(target=self.run, name=f"{name}-server", daemon=True)
+        print(f"[INFO] Serving {name} on http://{host}:{port} ({threads} threads)")
+
+    def run(self):
+        if create_server:
+            self.server.run()
+        else:
+            self.server.serve_forever()
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self, timeout):
+        # Stop accepting connections, then give in-flight requests time to finish
+        if create_server:
+            self.server.close()
+            self.server.task_dispatcher.shutdown(timeout=timeout)
+        else:
+            self.server.shutdown()
+            self.server.server_close()
+        self.thread.join(timeout)
+
+def serve(config):
+    global active_stream_port, held_stream_limit
+    if not create_server:
+        print("[WARN] waitress is not installed, falling back to werkzeug's threaded server")
+    if config['server_threads'] < MIN_PAGE_THREADS:
+        print(f"[WARN] server_threads raised to the minimum of {MIN_PAGE_THREADS}")
+        config['server_threads'] = MIN_PAGE_THREADS
+    servers = [WSGIServer("app", app, config['server_host'], config['server_port'], config['server_threads'])]
+    if config['stream_port']:
+        active_stream_port = config['stream_port']
+        servers.append(WSGIServer("video", streaming_app, config['server_host'],
+                                  config['stream_port'], config['stream_threads']))
+    if config['stream_port']:
+        spare = config['stream_threads']
+    else:
+        spare = config['server_threads'] - MIN_PAGE_THREADS
+    library_events.max_subscribers = min(app_settings.event_max_subscribers, spare // EVENT_POOL_SHARE)
+    if library_events.max_subscribers < app_settings.event_max_subscribers:
+        print(f"[INFO] Live library updates limited to {library_events.max_subscribers} pages "
+              f"by the server thread count")
+    if create_server and not config['stream_port'] and not app_settings.video_sendfile:
+        held_stream_limit = max(spare - library_events.max_subscribers, 1)  # One viewer always gets in
+        print(f"[INFO] Video limited to {held_stream_limit} concurrent streams, "
+              f"set stream_port to serve them from a pool of their own")
+
+    stopping = threading.Event()
+    def request_stop(signum, frame):
+        stopping.set()
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    start_background_services()
+    for server in servers:
+        server.start()
+    # Wake up now and then, signal handlers only run between waits on Windows
+    while not stopping.wait(1):
+        pass
+
+    print("[INFO] Shutting down")
+    library_events.close()
+    for server in servers:
+        server.stop(config['server_shutdown_timeout'])
+    library_watcher.stop()
+    collection.compact()
+
+# Command line tools for bulk work on the collection. They refuse to run
+# while the web server holds the instance lock, both would otherwise append
+# to the same journal.
+#
+#   python main.py import my_list.csv       CSV, JSON or JSON Lines
+#   python main.py import --scan            every title in the local library
+#   python main.py enrich                   fill in missing posters/trailers
+#   python main.py export backup.jsonl      one entry per line ("-" = stdout)
+#
+# Imports skip entries that already exist and enrichment only touches
+# entries that still miss data, so an interrupted run is resumed by simply
+# running the same command again.
+IMPORT_FIELDS = ('name', 'year', 'country', 'type', 'poster_url', 'ep', 'condition')
+IMPORT_INT_FIELDS = ('tmdb_id', 'trailer_checked')  # Trailer fields that are numbers, CSV gives strings
+
+def print_progress(label, done, total):
+    sys.stderr.write(f"\r{label}: {done}/{total}")
+    if done >= total:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
+
+def read_import_rows(path):
+    # Yields (category or None, row dict)
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        if ext == '.csv':
+            for row in csv.DictReader(f):
+                row = {(k or '').strip().lower(): (v or '').strip() for k, v in row.items()}
+                yield row.get('category') or None, row
+        elif ext in ('.jsonl', '.ndjson'):
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    yield row.get('category'), row
+        else:
+            data = json.load(f)
+            if isinstance(data, dict):
+                for category in ('series', 'movies'):
+                    for row in data.get(category, []):
+                        yield category, row
+            else:
+                for row in data:
+                    yield row.get('category'), row
+
+def scan_import_rows():
+    seen = set()
+    for row in ensure_library_index().files():
+        info = row['info']
+        if not info['name']:
+            continue
+        category = 'series' if info['type'] == 'series' else 'movies'
+        key = (category, info['name'], None if category == 'series' else info.get('year'))
+        if key in seen:
+            continue
+        seen.add(key)
+        entry = {'name': info['name'], 'year': key[2] or '', 'type': 'tv' if category == 'series' else 'movie'}
+        yield category, entry
+
+def import_entries(rows, default_category):
+    # Returns the ids of every imported row, added or already there, so an
+    # interrupted import picks up enriching where it stopped
+    added = skipped = 0
+    entry_ids = []
+    seen_ids = set()
+    for category, row in rows:
+        category = category or default_category or ('series' if row.get('ep') or row.get('condition') else 'movies')
+        if category not in ('series', 'movies') or not row.get('name'):
+            skipped += 1
+            continue
+        entry = {field: str(row.get(field) or '') for field in IMPORT_FIELDS}
+        if category != 'series':
+            del entry['ep'], entry['condition']
+        if not entry['type']:
+            entry['type'] = 'tv' if category == 'series' else 'movie'
+        # Exports carry the trailer lookup, keep it instead of redoing it
+        for field in TRAILER_FIELDS:
+            if field in row:
+                value = row[field] if row[field] != '' else None
+                if field in IMPORT_INT_FIELDS and isinstance(value, str) and value.isdigit():
+                    value = int(value)
+                entry[field] = value
+        entry_id = str(row.get('id') or '') or None
+        if entry_id:
+            if entry_id in seen_ids:
+                print(f"[WARN] Skipping '{entry['name']}', id {entry_id} appears more than once")
+                skipped += 1
+                continue
+            seen_ids.add(entry_id)
+        # An entry keeping its id is the same entry, even if renamed since
+        existing_id = collection.find(category, entry['name'], entry['year'], entry['type'])
+        if existing_id or (entry_id and collection.get(entry_id)):
+            entry_ids.append(existing_id or entry_id)
+            skipped += 1
+            continue
+        entry_ids.append(collection.add(category, entry, entry_id))
+        added += 1
+    print(f"[INFO] Imported {added} entries, skipped {skipped} existing or invalid rows")
+    return entry_ids
+
+def enrich_entry(entry_id):
+    found = collection.get(entry_id)
+    if not found:
+        return
+    category, entry = found
+    if not entry.get('poster_url'):
+        poster_resolver.limiter.acquire()
+        try:
+            poster_url = get_movie_poster(entry['name'], entry.get('type') or 'movie',
+                                          entry.get('year'), region=entry.get('country'))
+        except Exception as e:
+            print(f"\n[ERROR] Poster lookup failed for '{entry['name']}': {e}")
+            poster_url = None
+        if poster_url:
+            collection.update(entry_id, {'poster_url': poster_url})
+    if TrailerPrefetcher.is_stale(entry, time.time()):
+        trailer_prefetcher.resolve(entry_id)
+
+def enrich_entries(entry_ids, workers):
+    total = len(entry_ids)
+    if not total:
+        return
+    done = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(enrich_entry, entry_ids):
+            done += 1
+            print_progress("Enriching", done, total)
+
+def entries_missing_metadata(entry_ids=None):
+    now = time.time()
+    wanted = set(entry_ids) if entry_ids is not None else None
+    return [
+        entry['id']
+        for category in ('series', 'movies')
+        for entry in collection.items(category)
+        if (wanted is None or entry['id'] in wanted)
+        and (not entry.get('poster_url') or TrailerPrefetcher.is_stale(entry, now))
+    ]
+
+def export_entries(path):
+    out = sys.stdout if path == '-' else open(path, 'w', encoding='utf-8')
+    count = 0
+    try:
+        for category in ('series', 'movies'):
+            for entry in collection.items(category):
+                out.write(json.dumps(dict(entry, category=category), ensure_ascii=False) + "\n")
+                count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"[INFO] Exported {count} entries", file=sys.stderr)
+
+def run_cli(argv=None):
+    parser = argparse.ArgumentParser(prog="main.py", description="MyFlixVault media collection manager")
+    commands = parser.add_subparsers(dest="command")
+
+    import_cmd = commands.add_parser("import", help="bulk import entries and fetch their posters/trailers")
+    import_cmd.add_argument("file", nargs="?", help="CSV, JSON or JSON Lines file")
+    import_cmd.add_argument("--scan", action="store_true", help="import every title found in the local media path")
+    import_cmd.add_argument("--category", choices=("series", "movies"), help="category for rows that don't name one")
+    import_cmd.add_argument("--workers", type=int, default=8, help="concurrent metadata lookups")
+    import_cmd.add_argument("--no-enrich", action="store_true", help="skip poster/trailer lookups")
+
+    enrich_cmd = commands.add_parser("enrich", help="fetch missing posters/trailers for existing entries")
+    enrich_cmd.add_argument("--workers", type=int, default=8, help="concurrent metadata lookups")
+
+    export_cmd = commands.add_parser("export", help="export the collection as JSON Lines")
+    export_cmd.add_argument("file", help="output file, - for stdout")
+
+    serve_cmd = commands.add_parser("serve", help="run the web server (the default)")
+    serve_cmd.add_argument("--host", dest="server_host")
+    serve_cmd.add_argument("--port", dest="server_port", type=int)
+    serve_cmd.add_argument("--threads", dest="server_threads", type=int)
+    serve_cmd.add_argument("--stream-port", dest="stream_port", type=int, help="serve video from this port")
+    serve_cmd.add_argument("--stream-threads", dest="stream_threads", type=int)
+    serve_cmd.add_argument("--debug", action="store_true", help="Flask development server with reloader and debugger")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        if not args.file and not args.scan:
+            parser.error("import needs a file or --scan")
+        if args.scan and not media_path_ready():
+            parser.error("import --scan needs local_media_path set to a directory")
+        rows = scan_import_rows() if args.scan else read_import_rows(args.file)
+        entry_ids = import_entries(rows, args.category)
+        if not args.no_enrich:
+            enrich_entries(entries_missing_metadata(entry_ids), args.workers)
+        collection.compact()
+    elif args.command == "enrich":
+        enrich_entries(entries_missing_metadata(), args.workers)
+        collection.compact()
+    elif args.command == "export":
+        export_entries(args.file)
+    elif getattr(args, 'debug', False):
+        config = server_config(vars(args))
+        app.run(host=config['server_host'], port=config['server_port'], debug=True)
+    else:
+        serve(server_config(vars(args)))
 
 if __name__ == '__main__':
-    port = 8080
-    app.run(host='0.0.0.0', port=port, debug=True)
+    run_cli()
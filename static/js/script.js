@@ -4,85 +4,153 @@ document.querySelectorAll('.tab-button').forEach(button => {
     const tab = button.dataset.tab;
     const url = new URL(window.location);
     url.searchParams.set('tab', tab);
+    url.searchParams.delete('condition');
     window.location.href = url.toString();
   });
 });
 
-// Search and Condition Filtering
+// Search, condition filtering and infinite scrolling all go through /api/items
 const searchInput = document.getElementById('search-input');
+const sentinel = document.getElementById('scroll-sentinel');
+let nextCursor = sentinel.dataset.nextCursor;
+let loadingPage = false;
+let searchTimer = null;
 
-function filterCards() {
-  const query = searchInput.value.trim().toLowerCase();
+function activeContainer() {
   const activeTab = document.querySelector('.tab-button.active').dataset.tab;
-  const condition = document.querySelector('.condition-button.active')?.dataset.condition || 'all';
-  const container = document.getElementById(`${activeTab}-container`);
-  const cards = container.querySelectorAll('.card');
+  return document.getElementById(`${activeTab}-container`);
+}
 
-  cards.forEach(card => {
-    const name = (card.getAttribute('data-name') || '').toLowerCase();
-    const type = (card.getAttribute('data-type') || '').toLowerCase();
-    const ribbon = (card.querySelector('.ribbon')?.textContent || '').toLowerCase();
+function pageParams() {
+  const params = new URLSearchParams();
+  params.set('tab', document.querySelector('.tab-button.active').dataset.tab);
+  params.set('q', searchInput.value.trim().toLowerCase());
+  params.set('condition', document.querySelector('.condition-button.active')?.dataset.condition || 'all');
+  return params;
+}
 
-    const matchesQuery =
-      name.includes(query) ||
-      query.split(/\s+/).every(word => name.includes(word)) ||
-      type.includes(query);
+async function loadPage(reset) {
+  if (loadingPage && !reset) return;
+  if (!reset && !nextCursor) return;
+  loadingPage = true;
 
-    const matchesCondition = (condition === 'all') || (ribbon === condition);
+  const params = pageParams();
+  if (!reset) params.set('cursor', nextCursor);
 
-    card.style.display = (matchesQuery && matchesCondition) ? '' : 'none';
-  });
+  try {
+    const res = await fetch(`/api/items?${params.toString()}`);
+    const data = await res.json();
+    const container = activeContainer();
+    if (reset) {
+      container.innerHTML = data.html;
+      params.delete('cursor');
+      history.replaceState(null, '', `?${params.toString()}`);
+    } else {
+      container.insertAdjacentHTML('beforeend', data.html);
+    }
+    nextCursor = data.next_cursor === null ? '' : String(data.next_cursor);
+    prefetchTrailers();
+  } catch (error) {
+    console.error('Error:', error);
+  } finally {
+    loadingPage = false;
+  }
+}
+
+function filterCards() {
+  clearTimeout(searchTimer);
+  searchTimer = setTimeout(() => loadPage(true), 250);
 }
 
 searchInput.addEventListener('input', filterCards);
 
-document.addEventListener('DOMContentLoaded', () => {
-  const preQuery = searchInput?.value?.trim();
-  if (preQuery) filterCards();
-});
+new IntersectionObserver(entries => {
+  if (entries.some(entry => entry.isIntersecting)) loadPage(false);
+}, { rootMargin: '800px' }).observe(sentinel);
 
 // Condition Buttons
 document.querySelectorAll('.condition-button').forEach(button => {
   button.addEventListener('click', () => {
     document.querySelectorAll('.condition-button').forEach(btn => btn.classList.remove('active'));
     button.classList.add('active');
-    filterCards();
+    loadPage(true);
   });
 });
 
+// Cards are replaced while searching and scrolling, so clicks are delegated
+function onCardClick(handler) {
+  document.querySelectorAll('.tab-content').forEach(container => {
+    container.addEventListener('click', e => {
+      const card = e.target.closest('.card');
+      // Ignore clicks on the Edit/Delete links
+      if (!card || e.target.closest('.actions')) return;
+      handler(card);
+    });
+  });
+}
+
 // Trailer Click
-document.querySelectorAll('.card').forEach(card => {
-  card.addEventListener('click', async () => {
-    const h3 = card.querySelector('h3');
-    const fullText = h3.textContent.trim();
-    const yearMatch = fullText.match(/\((\d{4})\)$/);
-    const year = yearMatch ? yearMatch[1] : '';
-    const name = fullText.replace(/\(\d{4}\)$/, '').trim();
-    let type = card.getAttribute('data-type');
-    if (type === "series") {
-      type = "tv";
-    }
-    const country = card.getAttribute('data-country') || '';
+onCardClick(async card => {
+  // Prefetched on the server, no lookup needed
+  if (card.dataset.trailer !== undefined) {
+    showTrailer(card.dataset.trailer);
+    return;
+  }
 
-    // Build query parameters
-    const params = new URLSearchParams();
-    params.append('name', name);
-    params.append('type', type);
-    if (year) params.append('year', year);
-    if (country) params.append('country', country);
+  const h3 = card.querySelector('h3');
+  const fullText = h3.textContent.trim();
+  const yearMatch = fullText.match(/\((\d{4})\)$/);
+  const year = yearMatch ? yearMatch[1] : '';
+  const name = fullText.replace(/\(\d{4}\)$/, '').trim();
+  let type = card.getAttribute('data-type');
+  if (type === "series") {
+    type = "tv";
+  }
+  const country = card.getAttribute('data-country') || '';
 
-    const res = await fetch(`/trailer?${params.toString()}`);
-    const data = await res.json();
+  // Build query parameters
+  const params = new URLSearchParams();
+  params.append('name', name);
+  params.append('type', type);
+  if (year) params.append('year', year);
+  if (country) params.append('country', country);
 
-    if (data.trailer_url) {
-      document.getElementById('trailer-frame').src = data.trailer_url;
-      document.getElementById('trailer-modal').style.display = 'flex';
-    } else {
-      alert("Trailer not found!");
-    }
-  });
+  const res = await fetch(`/trailer?${params.toString()}`);
+  const data = await res.json();
+  showTrailer(data.trailer_url);
 });
 
+function showTrailer(trailerUrl) {
+  if (trailerUrl) {
+    document.getElementById('trailer-frame').src = trailerUrl;
+    document.getElementById('trailer-modal').style.display = 'flex';
+  } else {
+    alert("Trailer not found!");
+  }
+}
+
+// Fill in stored trailers for cards rendered before they were resolved
+async function prefetchTrailers() {
+  const cards = document.querySelectorAll('.card[data-id]:not([data-trailer])');
+  if (cards.length === 0) return;
+
+  const params = new URLSearchParams();
+  cards.forEach(card => params.append('id', card.dataset.id));
+
+  try {
+    const res = await fetch(`/trailers?${params.toString()}`);
+    const data = await res.json();
+    cards.forEach(card => {
+      const trailer = data.trailers[card.dataset.id];
+      if (trailer && !trailer.pending) card.dataset.trailer = trailer.trailer_url || '';
+    });
+  } catch (error) {
+    console.error('Error:', error);
+  }
+}
+
+prefetchTrailers();
+
 
 // Trailer Modal Close
 function closeTrailer() {
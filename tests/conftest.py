@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture(scope="session")
+def main(tmp_path_factory):
+    # main.py creates its databases and folders in the working directory
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("main"))
+    sys.path.insert(0, ROOT)
+    try:
+        import main
+        yield main
+    finally:
+        os.chdir(cwd)
@@ -0,0 +1,46 @@
+import json
+
+def entry(name):
+    return {'name': name, 'year': '', 'country': '', 'type': 'movie', 'poster_url': ''}
+
+def names(store):
+    return [item['name'] for item in store.items('movies')]
+
+def test_torn_journal_line_is_dropped_and_appends_continue(main, tmp_path):
+    snapshot, journal = str(tmp_path / "my_list.json"), str(tmp_path / "my_list.journal")
+    store = main.CollectionStore(snapshot, journal)
+    store.add('movies', entry("X1"))
+    store.add('movies', entry("X2"))
+    store.journal.close()
+
+    # Cut the last journal line in half, as a crash during the write would
+    with open(journal, 'rb') as f:
+        data = f.read()
+    with open(journal, 'wb') as f:
+        f.write(data[:-20])
+
+    store = main.CollectionStore(snapshot, journal)
+    assert names(store) == ["X1"]
+    store.add('movies', entry("X3"))
+    store.journal.close()
+
+    store = main.CollectionStore(snapshot, journal)
+    assert names(store) == ["X1", "X3"]
+    with open(journal, encoding='utf-8') as f:
+        for line in f:
+            json.loads(line)
+
+def test_unterminated_last_line_is_kept(main, tmp_path):
+    snapshot, journal = str(tmp_path / "my_list.json"), str(tmp_path / "my_list.journal")
+    store = main.CollectionStore(snapshot, journal)
+    store.add('movies', entry("X1"))
+    store.journal.close()
+    with open(journal, 'rb') as f:
+        data = f.read()
+    with open(journal, 'wb') as f:
+        f.write(data.rstrip(b"\n"))
+
+    store = main.CollectionStore(snapshot, journal)
+    store.add('movies', entry("X2"))
+    store.journal.close()
+    assert names(main.CollectionStore(snapshot, journal)) == ["X1", "X2"]
@@ -0,0 +1,16 @@
+def test_subscribers_are_capped(main):
+    events = main.EventBroadcaster(2)
+    first, second = events.subscribe(), events.subscribe()
+    assert events.subscribe() is None
+    events.unsubscribe(first)
+    assert events.subscribe() is not None
+
+def test_close_wakes_full_subscribers(main):
+    events = main.EventBroadcaster(1)
+    subscriber = events.subscribe()
+    for generation in range(150):
+        events.publish({'generation': generation})
+    events.close()
+    queued = [subscriber.get_nowait() for _ in range(subscriber.qsize())]
+    assert queued[-1] is None
+    assert events.subscribe() is None
@@ -0,0 +1,28 @@
+import pytest
+
+@pytest.fixture
+def probed(main, monkeypatch):
+    codecs = {}
+    monkeypatch.setattr(main.HlsTranscoder, 'available', staticmethod(lambda: True))
+    monkeypatch.setattr(main.HlsTranscoder, 'probe', staticmethod(lambda path, size, mtime: codecs[path]))
+    monkeypatch.setattr(main.app_settings, 'transcode_mode', 'auto')
+    return codecs
+
+@pytest.mark.parametrize("name, video, audio, plan", [
+    ("a.mp4", "h264", "aac", "direct"),
+    ("a.mkv", "h264", "aac", "remux"),
+    ("a.mkv", "h264", None, "remux"),
+    ("a.mkv", "h264", "ac3", "audio"),
+    ("a.mp4", "h264", "dts", "audio"),
+    ("a.mkv", "hevc", "aac", "transcode"),
+])
+def test_plan(main, probed, tmp_path, name, video, audio, plan):
+    path = str(tmp_path / name)
+    open(path, 'wb').close()
+    probed[path] = (video, audio)
+    assert main.hls_transcoder.plan(path) == plan
+
+def test_audio_plan_copies_the_video(main, tmp_path):
+    cmd = main.hls_transcoder.command("in.mkv", str(tmp_path), 'audio')
+    assert cmd[cmd.index('-c:v') + 1] == 'copy'
+    assert cmd[cmd.index('-c:a') + 1] == 'aac'
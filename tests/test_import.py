@@ -0,0 +1,44 @@
+import json
+
+def entry(name, **fields):
+    return dict({'name': name, 'year': '2020', 'country': 'US', 'type': 'movie', 'poster_url': 'http://p/' + name}, **fields)
+
+def store(main, tmp_path, name):
+    return main.CollectionStore(str(tmp_path / f"{name}.json"), str(tmp_path / f"{name}.journal"))
+
+def test_export_import_round_trip(main, tmp_path, monkeypatch):
+    source = store(main, tmp_path, "source")
+    source.add('movies', entry("Up", trailer_url="https://www.youtube.com/embed/k1", tmdb_id=14160,
+                               trailer_key="k1", trailer_checked=1700000000))
+    source.add('movies', entry("Heat", trailer_url=None, tmdb_id=None, trailer_key=None, trailer_checked=1700000001))
+    source.add('series', entry("Dark", type='tv', ep='S01E02', condition='watching'))
+    monkeypatch.setattr(main, 'collection', source)
+    main.export_entries(str(tmp_path / "backup.jsonl"))
+
+    target = store(main, tmp_path, "target")
+    monkeypatch.setattr(main, 'collection', target)
+    main.import_entries(main.read_import_rows(str(tmp_path / "backup.jsonl")), None)
+    for category in ('series', 'movies'):
+        assert target.items(category) == source.items(category)
+
+    # Importing the same export again adds nothing
+    main.import_entries(main.read_import_rows(str(tmp_path / "backup.jsonl")), None)
+    assert len(target.items('movies')) == 2
+
+def test_duplicate_ids_are_rejected(main, tmp_path, monkeypatch):
+    rows = [dict(entry("Up"), id="abc", category='movies'), dict(entry("Heat"), id="abc", category='movies')]
+    path = tmp_path / "rows.jsonl"
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    target = store(main, tmp_path, "target")
+    monkeypatch.setattr(main, 'collection', target)
+    main.import_entries(main.read_import_rows(str(path)), None)
+    assert [(item['id'], item['name']) for item in target.items('movies')] == [("abc", "Up")]
+
+def test_csv_trailer_numbers(main, tmp_path, monkeypatch):
+    path = tmp_path / "rows.csv"
+    path.write_text("name,year,tmdb_id,trailer_checked,trailer_url\nUp,2009,14160,1700000000,\n")
+    target = store(main, tmp_path, "target")
+    monkeypatch.setattr(main, 'collection', target)
+    main.import_entries(main.read_import_rows(str(path)), 'movies')
+    item = target.items('movies')[0]
+    assert (item['tmdb_id'], item['trailer_checked'], item['trailer_url']) == (14160, 1700000000, None)
@@ -0,0 +1,20 @@
+import pytest
+
+@pytest.fixture(params=["", "missing", "file"])
+def unusable_path(main, tmp_path, monkeypatch, request):
+    path = {"": "", "missing": str(tmp_path / "missing"), "file": str(tmp_path / "file.mkv")}[request.param]
+    if request.param == "file":
+        open(path, "w").close()
+    monkeypatch.setattr(main.app_settings, 'local_media_path', path)
+
+    def refresh(base_path):
+        raise AssertionError(f"scanned {base_path!r}")
+    monkeypatch.setattr(main.library_index, 'refresh', refresh)
+
+def test_continue_watching_without_media_path(main, unusable_path):
+    response = main.app.test_client().get('/continue_watching')
+    assert response.get_json() == {"results": []}
+
+def test_next_episode_without_media_path(main, unusable_path):
+    response = main.app.test_client().get('/next_episode', query_string={'path': 'Show/Dark.S01E01.mkv'})
+    assert response.get_json() == {"next": None}
@@ -0,0 +1,19 @@
+import json
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS = os.path.join(ROOT, "benchmarks", "release_names.json")
+
+with open(CORPUS, 'r', encoding='utf-8') as f:
+    CASES = json.load(f)
+
+@pytest.mark.parametrize("case", CASES, ids=[case['filename'] for case in CASES])
+def test_release_name(main, case):
+    assert main.extract_media_info(case['filename']) == case['expected']
+
+def test_results_are_copies(main):
+    info = main.extract_media_info("Dark.S01E02.WEB-DL.mp4")
+    info['name'] = "changed"
+    assert main.extract_media_info("Dark.S01E02.WEB-DL.mp4")['name'] == "Dark"
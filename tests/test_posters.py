@@ -0,0 +1,22 @@
+import json
+import os
+
+def test_rows_without_a_hash_are_dropped(main, tmp_path):
+    folder = tmp_path / "temp"
+    folder.mkdir()
+    db = str(tmp_path / "poster_cache.db")
+    store = main.PosterStore(db, str(folder), 10 ** 9, 'lru')
+    for content, files in (("a" * 32, ["a" * 32 + ".jpg"]), ("b" * 32, ["b" * 32 + ".jpg"])):
+        for name in files:
+            (folder / name).write_bytes(b"image " + content.encode())
+        store.add("url-" + content, content, files)
+    # A row from before hashes were recorded, only the size is known
+    store.conn.execute("UPDATE blobs SET files = ? WHERE content = ?",
+                       (json.dumps({"b" * 32 + ".jpg": [38]}), "b" * 32))
+    store.conn.commit()
+
+    store = main.PosterStore(db, str(folder), 10 ** 9, 'lru')
+    store.verify()
+    assert store.has("url-" + "a" * 32)
+    assert not store.has("url-" + "b" * 32)
+    assert sorted(os.listdir(folder)) == ["a" * 32 + ".jpg"]
@@ -0,0 +1,48 @@
+import pytest
+
+def entry(name, **fields):
+    return dict({'name': name, 'year': '', 'country': '', 'type': 'series', 'condition': ''}, **fields)
+
+@pytest.fixture
+def store(main, tmp_path, monkeypatch):
+    store = main.CollectionStore(str(tmp_path / "my_list.json"), str(tmp_path / "my_list.journal"))
+    monkeypatch.setattr(main, 'collection', store)
+    monkeypatch.setattr(main, 'search_index', main.SearchIndex(store))
+    yield store
+    store.journal.close()
+
+def names(main, query, condition=None):
+    return [item['name'] for _, item in main.search_index.search('series', query, condition)]
+
+def test_arabic_and_cjk_queries(main, store):
+    for name in ("الهيبة", "進撃の巨人", "Dark", "Ékipe"):
+        store.add('series', entry(name))
+    assert names(main, "الهيبة") == ["الهيبة"]
+    assert names(main, "الهي") == ["الهيبة"]
+    assert names(main, "進撃") == ["進撃の巨人"]
+    assert names(main, "ÉKIPE") == ["Ékipe"]
+
+def test_query_without_tokens_matches_as_substring(main, store):
+    for name in ("M*A*S*H", "Dark"):
+        store.add('series', entry(name))
+    assert names(main, "*") == ["M*A*S*H"]
+    assert names(main, "!!") == []
+    assert names(main, "") == ["M*A*S*H", "Dark"]
+
+def test_cursor_survives_deletes_before_it(main, store):
+    ids = [store.add('series', entry(f"Show {i}")) for i in range(6)]
+    page, cursor, total = main.get_page('series', limit=3)
+    assert [item['name'] for _, item in page] == ["Show 0", "Show 1", "Show 2"]
+    assert cursor == ids[2]
+
+    store.delete(ids[0])
+    page, cursor, _ = main.get_page('series', cursor=cursor, limit=3)
+    assert [item['name'] for _, item in page] == ["Show 3", "Show 4", "Show 5"]
+    assert cursor is None
+
+def test_cursor_survives_deleting_the_cursor_item(main, store):
+    ids = [store.add('series', entry(f"Show {i}")) for i in range(4)]
+    _, cursor, _ = main.get_page('series', limit=2)
+    store.delete(cursor)
+    page, _, _ = main.get_page('series', cursor=cursor, limit=2)
+    assert [item['name'] for _, item in page] == ["Show 2", "Show 3"]
@@ -0,0 +1,54 @@
+import pytest
+from werkzeug.wsgi import FileWrapper
+
+SIZE = 1000
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(bytes(i % 256 for i in range(SIZE)))
+    return str(path)
+
+@pytest.fixture(params=['iterator', 'file_wrapper'])
+def fetch(main, request):
+    environ = {'wsgi.file_wrapper': FileWrapper} if request.param == 'file_wrapper' else {}
+
+    def fetch(path, range_header=None):
+        headers = {'Range': range_header} if range_header else {}
+        with main.app.test_request_context(headers=headers, environ_overrides=environ):
+            response = main.stream_file(path)
+            body = b"".join(response.response) if response.response else b""
+            response.close()
+        return response, body
+    return fetch
+
+def test_single_range_is_partial(fetch, video):
+    response, body = fetch(video, "bytes=100-199")
+    assert response.status_code == 206
+    assert response.headers['Content-Range'] == f"bytes 100-199/{SIZE}"
+    assert response.headers['Content-Length'] == "100"
+    assert body == bytes(i % 256 for i in range(100, 200))
+
+def test_open_ended_range_runs_to_the_end(fetch, video):
+    response, body = fetch(video, "bytes=900-")
+    assert response.status_code == 206
+    assert len(body) == 100
+
+def test_multiple_ranges_send_the_whole_file(fetch, video):
+    response, body = fetch(video, "bytes=0-9,20-29")
+    assert response.status_code == 200
+    assert 'Content-Range' not in response.headers
+    assert len(body) == SIZE
+
+def test_unsatisfiable_range(fetch, video):
+    response, body = fetch(video, f"bytes={SIZE}-")
+    assert response.status_code == 416
+    assert response.headers['Content-Range'] == f"bytes */{SIZE}"
+    assert body == b""
+
+def test_file_wrapper_keeps_fileno(main, video):
+    streamed = main.StreamedFile(video, 10, 5, main.stream_stats.start(True))
+    assert streamed.fileno() == streamed.file.fileno()
+    assert streamed.read() == bytes(range(10, 15))
+    assert streamed.read(10) == b""
+    streamed.close()